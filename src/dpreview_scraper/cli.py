@@ -10,6 +10,7 @@ from rich.table import Table
 
 from dpreview_scraper import __version__
 from dpreview_scraper.config import settings
+from dpreview_scraper.models.camera import SearchResult
 from dpreview_scraper.scraper.browser import BrowserManager
 from dpreview_scraper.scraper.search import SearchScraper
 from dpreview_scraper.scraper.product import ProductScraper
@@ -102,6 +103,7 @@ async def _run_scraper(
     progress_tracker = ProgressTracker(settings.progress_file)
 
     archive_manager = None  # Initialize here to avoid UnboundLocalError
+    product_scraper = None
 
     try:
         await browser.start()
@@ -156,8 +158,20 @@ async def _run_scraper(
         if fetch_archive:
             archive_manager = ArchiveManager()
 
-        # Scrape products
-        product_scraper = ProductScraper(browser, rate_limiter)
+        # Scrape products with a small pool of workers so one product's page loads
+        # and Cloudflare waits overlap with the next; the shared rate limiter still
+        # paces the actual requests. One review page per worker can sit waiting for
+        # its specs tab, so keep at least one page slot beyond the worker count.
+        workers = max(1, settings.concurrent_products)
+        product_scraper = ProductScraper(
+            browser,
+            rate_limiter,
+            max_open_pages=max(ProductScraper.MAX_OPEN_PAGES, workers + 1),
+        )
+
+        queue: asyncio.Queue[SearchResult] = asyncio.Queue()
+        for search_result in search_results:
+            queue.put_nowait(search_result)
 
         with Progress(
             SpinnerColumn(),
@@ -168,14 +182,13 @@ async def _run_scraper(
         ) as progress:
             task = progress.add_task("Scraping cameras...", total=len(search_results))
 
-            for search_result in search_results:
+            async def scrape_one(search_result: SearchResult) -> None:
                 try:
                     # Skip if already exists and not resuming
                     if yaml_writer.camera_exists(search_result.product_code):
                         logger.info(f"Skipping existing: {search_result.product_code}")
                         progress_tracker.mark_completed(search_result.product_code)
-                        progress.advance(task)
-                        continue
+                        return
 
                     # Scrape product
                     camera = await product_scraper.scrape_product(search_result)
@@ -183,8 +196,7 @@ async def _run_scraper(
                     if not camera:
                         logger.warning(f"Failed to scrape: {search_result.product_code}")
                         progress_tracker.mark_failed(search_result.product_code)
-                        progress.advance(task)
-                        continue
+                        return
 
                     # Fetch archive URL if requested
                     if archive_manager and camera.review_url:
@@ -192,24 +204,37 @@ async def _run_scraper(
                         if archive_url:
                             camera.DPRReviewArchiveURL = archive_url
 
-                    # Write YAML
-                    yaml_writer.write_camera(camera)
+                    # Write YAML off the event loop, so other workers' page loads
+                    # keep progressing while the file is serialized and written
+                    await asyncio.to_thread(yaml_writer.write_camera, camera)
                     progress_tracker.mark_completed(search_result.product_code)
 
                 except Exception as e:
                     logger.error(f"Error scraping {search_result.product_code}: {e}")
                     progress_tracker.mark_failed(search_result.product_code)
 
-                progress.advance(task)
+            async def worker() -> None:
+                while not queue.empty():
+                    await scrape_one(queue.get_nowait())
+                    progress.advance(task)
+
+            async with asyncio.TaskGroup() as task_group:
+                for _ in range(min(workers, len(search_results))):
+                    task_group.create_task(worker())
 
         # Print final stats
         console.print()
         console.print("[bold green]Scraping complete![/bold green]")
+        progress_tracker.flush()
         stats = progress_tracker.get_stats()
         _print_stats(stats)
 
     finally:
+        # Write any progress marks still waiting for a batched save
+        progress_tracker.flush()
         await browser.stop()
+        if product_scraper:
+            await product_scraper.close()
         if archive_manager:
             await archive_manager.close()
 
@@ -510,6 +535,14 @@ async def _backfill_archives_async(directory: Path, create_if_missing: bool):
         console.print(f"Files with archives: {skipped}")
         console.print()
 
+        # Lookups without archive creation are independent, so run them concurrently
+        prefetched_archives = None
+        if not create_if_missing:
+            console.print("[bold]Looking up archives...[/bold]")
+            prefetched_archives = await archive_manager.get_archive_urls(
+                [_review_url_for(camera.ProductCode) for _, camera in needs_archive]
+            )
+
         # Second pass: fetch and update archives
         with Progress(
             SpinnerColumn(),
@@ -522,18 +555,15 @@ async def _backfill_archives_async(directory: Path, create_if_missing: bool):
                 "Fetching archives...", total=len(needs_archive)
             )
 
-            for yaml_file, camera in needs_archive:
+            for index, (yaml_file, camera) in enumerate(needs_archive):
                 try:
-                    # Reconstruct review URL (pattern: /reviews/{product_code}-review)
-                    review_url = f"{settings.base_url}/reviews/{camera.ProductCode}-review"
-
                     # Fetch or create archive
-                    if create_if_missing:
+                    if prefetched_archives is not None:
+                        archive_url = prefetched_archives[index]
+                    else:
                         archive_url = await archive_manager.get_or_create_archive(
-                            review_url, create_if_missing=True
+                            _review_url_for(camera.ProductCode), create_if_missing=True
                         )
-                    else:
-                        archive_url = await archive_manager.get_archive_url(review_url)
 
                     if archive_url:
                         # Update camera object
@@ -596,6 +626,11 @@ def version():
     console.print(f"DPReview Camera Scraper v{__version__}")
 
 
+def _review_url_for(product_code: str) -> str:
+    """Reconstruct a camera's review URL (pattern: /reviews/{product_code}-review)."""
+    return f"{settings.base_url}/reviews/{product_code}-review"
+
+
 def _print_stats(stats: dict):
     """Print progress statistics."""
     table = Table(title="Scraping Statistics")
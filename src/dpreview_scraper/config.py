@@ -14,15 +14,19 @@ class Settings(BaseSettings):
     request_timeout: int = 30
     retry_attempts: int = 3
     retry_delay: float = 2.0
+    concurrent_products: int = 2  # Products scraped at once (requests still share the rate limit)
 
     # Browser
     headless: bool = True
     browser_timeout: int = 30000  # milliseconds
+    # Recreate the shared context after this many pages (0 = never)
+    context_rotation_pages: int = 200
     user_agent: str = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
     # Output
     output_dir: Path = Path("output")
     progress_file: Path = Path(".scrape_progress.json")
+    storage_state_file: Path = Path(".browser_state.json")  # Cookies incl. cf_clearance
 
     # Date filtering
     after_date: str = "2023-03-01"  # Default to after existing database
@@ -30,6 +34,7 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
     verbose: bool = False
+    plain_logs: bool = False  # Force plain-text logs even on a terminal
 
     model_config = SettingsConfigDict(
         env_prefix="DPREVIEW_",
@@ -1,5 +1,6 @@
 """Camera model combining all data."""
 
+import re
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
@@ -10,6 +11,19 @@ from dpreview_scraper.models.specs import CameraSpecs
 _ReviewDataType = ReviewData
 _CameraSpecsType = CameraSpecs
 
+# DPReview site/image host prefix, or a thumbnail size token (e.g. TS375x375~),
+# both stripped from output URLs in a single pass
+URL_CLEANUP_PATTERN = re.compile(
+    r"^https://(?:(?:www|m)\.dpreview\.com|[1-4]\.img-dpreview\.com)|TS\d+x\d+~"
+)
+
+
+def _make_relative_url(url: str) -> str:
+    """Convert absolute URL to relative path and remove size parameters."""
+    if not url:
+        return url
+    return URL_CLEANUP_PATTERN.sub("", url)
+
 
 class SearchResult(BaseModel):
     """Camera search result from the product search page."""
@@ -20,6 +34,7 @@ class SearchResult(BaseModel):
     image_url: str = ""
     announced: Optional[str] = None
     short_specs: List[str] = Field(default_factory=list)
+    review_url: Optional[str] = None  # Set when the listing row links a review
 
 
 class Camera(BaseModel):
@@ -58,40 +73,18 @@ class Camera(BaseModel):
 
     def to_yaml_dict(self) -> dict:
         """Convert to dict preserving field order for YAML output."""
-        import re
-
-        def make_relative_url(url: str) -> str:
-            """Convert absolute URL to relative path and remove size parameters."""
-            if not url:
-                return url
-            # Strip domain from DPReview URLs
-            for domain in [
-                "https://www.dpreview.com",
-                "https://m.dpreview.com",
-                "https://1.img-dpreview.com",
-                "https://2.img-dpreview.com",
-                "https://3.img-dpreview.com",
-                "https://4.img-dpreview.com",
-            ]:
-                if url.startswith(domain):
-                    url = url[len(domain):]
-                    break
-            # Remove thumbnail size parameters (e.g., TS375x375~, TS40x40~)
-            url = re.sub(r'TS\d+x\d+~', '', url)
-            return url
-
         data = {
             "DPRReviewArchiveURL": self.DPRReviewArchiveURL,
             "ProductCode": self.ProductCode,
             "Award": self.Award,
-            "ImageURL": make_relative_url(self.ImageURL),
+            "ImageURL": _make_relative_url(self.ImageURL),
             "Name": self.Name,
             "ShortSpecs": self.ShortSpecs,
             "ReviewScore": self.ReviewScore,
-            "URL": make_relative_url(self.URL),
+            "URL": _make_relative_url(self.URL),
             "ReviewData": {
                 "ExecutiveSummary": self.ReviewData.ExecutiveSummary,
-                "ProductPhotos": [make_relative_url(p) for p in self.ReviewData.ProductPhotos],
+                "ProductPhotos": [_make_relative_url(p) for p in self.ReviewData.ProductPhotos],
                 "ReviewSummary": self._format_review_summary(),
                 "ASIN": self.ReviewData.ASIN,
             },
@@ -3,6 +3,7 @@
 import re
 from typing import List
 
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from dpreview_scraper.parsers.parse_utils import (
@@ -14,17 +15,58 @@ from dpreview_scraper.utils.logging import logger
 OVERVIEW_SUFFIX = " Overview"
 BULLET_POINT_PATTERN = re.compile(r'\s*[•·].*', re.DOTALL)
 
+# Precompiled CSS selectors (selector text kept alongside for debug logging)
+H1_SELECTOR = sv.compile("h1")
+BREADCRUMB_SELECTOR = sv.compile("div.breadcrumbs a.item:last-child")
+MAIN_IMAGE_SELECTORS = [
+    (selector, sv.compile(selector))
+    for selector in [
+        "div#productImage",
+        "div.productImage",
+        "div.mainProductImage",
+        "div.productImageMain",
+    ]
+]
+PRODUCT_SHOT_SELECTOR = sv.compile("div.productShotThumbnail")
+QUICK_SPECS_TABLE_SELECTOR = sv.compile("div.rightColumn.quickSpecs table")
+ROW_SELECTOR = sv.compile("tr")
+TH_LABEL_SELECTOR = sv.compile("th.label")
+TD_VALUE_SELECTOR = sv.compile("td.value")
+BADGE_SELECTOR = sv.compile("div.productBadgeAndScore")
+# Review preview blocks, shared by award and preview extraction
+REVIEW_SECTION_SELECTORS = [
+    (selector, sv.compile(selector))
+    for selector in [
+        "div.reviewPreview",
+        "div.review-preview",
+        "td.review",
+        "div.productReview",
+        "div.reviewInfo",
+    ]
+]
+AWARD_SPAN_SELECTOR = sv.compile("span.award")
+MAIN_CONTENT_AWARD_SELECTORS = [
+    sv.compile(selector)
+    for selector in [
+        "div.mainContent [data-award]",
+        "div.leftColumn [data-award]",
+        "div.mainContent .badge",
+        "div.leftColumn .badge",
+    ]
+]
+REVIEW_DATE_SELECTOR = sv.compile("div.reviewDate, span.reviewDate, div.review span.date")
+
 
 def extract_name(soup: BeautifulSoup) -> str:
     """Extract camera name from overview page."""
-    h1 = soup.select_one("h1")
+    h1 = H1_SELECTOR.select_one(soup)
     if h1:
         title = h1.get_text(strip=True)
         if title.endswith(OVERVIEW_SUFFIX):
             return title[:-len(OVERVIEW_SUFFIX)]
         return title
 
-    breadcrumb = soup.select_one("div.breadcrumbs a.item:last-child")
+    breadcrumb = BREADCRUMB_SELECTOR.select_one(soup)
     if breadcrumb:
         return breadcrumb.get_text(strip=True)
 
@@ -33,15 +75,8 @@ def extract_name(soup: BeautifulSoup) -> str:
 
 def extract_image_url(soup: BeautifulSoup) -> str:
     """Extract main product image URL (not product photos from gallery)."""
-    main_image_selectors = [
-        "div#productImage",
-        "div.productImage",
-        "div.mainProductImage",
-        "div.productImageMain",
-    ]
-
-    for selector in main_image_selectors:
-        element = soup.select_one(selector)
+    for selector, compiled in MAIN_IMAGE_SELECTORS:
+        element = compiled.select_one(soup)
         if element:
             style = element.get("style", "")
             if style:
@@ -61,7 +96,7 @@ def extract_image_url(soup: BeautifulSoup) -> str:
                     logger.debug(f"Found main product image from img tag with selector '{selector}': {clean_url}")
                     return clean_url
 
-    thumbnail = soup.select_one("div.productShotThumbnail")
+    thumbnail = PRODUCT_SHOT_SELECTOR.select_one(soup)
     if thumbnail:
         style = thumbnail.get("style", "")
         clean_url = extract_clean_url_from_style(style)
@@ -77,12 +112,12 @@ def extract_short_specs(soup: BeautifulSoup) -> List[str]:
     """Extract short specs (key features) from overview page."""
     specs = []
 
-    quick_specs_table = soup.select_one("div.rightColumn.quickSpecs table")
+    quick_specs_table = QUICK_SPECS_TABLE_SELECTOR.select_one(soup)
     if quick_specs_table:
-        rows = quick_specs_table.select("tr")
+        rows = ROW_SELECTOR.select(quick_specs_table)
         for row in rows:
-            label_elem = row.select_one("th.label")
-            value_elem = row.select_one("td.value")
+            label_elem = TH_LABEL_SELECTOR.select_one(row)
+            value_elem = TD_VALUE_SELECTOR.select_one(row)
             if label_elem and value_elem:
                 value = value_elem.get_text(strip=True)
                 specs.append(f"{value}")
@@ -92,7 +127,7 @@ def extract_short_specs(soup: BeautifulSoup) -> List[str]:
 
 def extract_award(soup: BeautifulSoup) -> str:
     """Extract review award (gold, silver, bronze, recommended) for the current product."""
-    badge_elem = soup.select_one("div.productBadgeAndScore")
+    badge_elem = BADGE_SELECTOR.select_one(soup)
     if badge_elem:
         classes = badge_elem.get("class", [])
         for cls in classes:
@@ -104,18 +139,10 @@ def extract_award(soup: BeautifulSoup) -> str:
             logger.debug("Found 'recommended' in productBadgeAndScore text")
             return "recommended"
 
-    review_sections = [
-        "div.reviewPreview",
-        "div.review-preview",
-        "td.review",
-        "div.productReview",
-        "div.reviewInfo",
-    ]
-
-    for section_selector in review_sections:
-        section = soup.select_one(section_selector)
+    for section_selector, compiled in REVIEW_SECTION_SELECTORS:
+        section = compiled.select_one(soup)
         if section:
-            award_elem = section.select_one("span.award")
+            award_elem = AWARD_SPAN_SELECTOR.select_one(section)
             if award_elem:
                 classes = award_elem.get("class", [])
                 for cls in classes:
@@ -133,15 +160,8 @@ def extract_award(soup: BeautifulSoup) -> str:
             elif "recommended" in text:
                 return "recommended"
 
-    main_content_selectors = [
-        "div.mainContent [data-award]",
-        "div.leftColumn [data-award]",
-        "div.mainContent .badge",
-        "div.leftColumn .badge",
-    ]
-
-    for selector in main_content_selectors:
-        elem = soup.select_one(selector)
+    for compiled in MAIN_CONTENT_AWARD_SELECTORS:
+        elem = compiled.select_one(soup)
         if elem:
             data_award = elem.get("data-award", "").lower()
             if data_award in ["gold", "silver", "bronze", "recommended"]:
@@ -158,16 +178,8 @@ def extract_award(soup: BeautifulSoup) -> str:
 
 def extract_review_preview(soup: BeautifulSoup, review_score: int, award: str) -> str:
     """Extract review preview text from overview page."""
-    preview_selectors = [
-        "div.reviewPreview",
-        "div.review-preview",
-        "td.review",
-        "div.productReview",
-        "div.reviewInfo",
-    ]
-
-    for selector in preview_selectors:
-        elem = soup.select_one(selector)
+    for selector, compiled in REVIEW_SECTION_SELECTORS:
+        elem = compiled.select_one(soup)
         if elem:
             text = elem.get_text(separator='\n', strip=False)
             if review_score > 0 and (
@@ -181,7 +193,7 @@ def extract_review_preview(soup: BeautifulSoup, review_score: int, award: str) -
     if review_score > 0:
         award_text = f"{award.title()} Award" if award else ""
         review_date = ""
-        date_elem = soup.select_one("div.reviewDate, span.reviewDate, div.review span.date")
+        date_elem = REVIEW_DATE_SELECTOR.select_one(soup)
         if date_elem:
             review_date = date_elem.get_text(strip=True)
 
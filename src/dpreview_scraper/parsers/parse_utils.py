@@ -2,12 +2,14 @@
 
 import re
 
+from bs4 import NavigableString, Tag
+
 # Precompiled regex patterns
 URL_FROM_CSS_PATTERN = re.compile(r'url\(["\']?([^"\'()]+)["\']?\)')
 DPREVIEW_SIZE_PARAM_PATTERN = re.compile(r'TS\d+x\d+~')
 MULTIPLE_SPACES_PATTERN = re.compile(r'\s+')
-SPACE_BEFORE_INCH_PATTERN = re.compile(r'\s+(″|"|\'\'|")')
-SPACE_BEFORE_PAREN_PATTERN = re.compile(r'\s+\)')
+# Space before an inch/quote symbol or a closing parenthesis, removed in one pass
+SPACE_BEFORE_CLOSER_PATTERN = re.compile(r'\s+(″|"|\'\'|\))')
 
 
 def normalize_whitespace(text: str) -> str:
@@ -22,8 +24,7 @@ def normalize_whitespace(text: str) -> str:
         Text with normalized whitespace
     """
     text = MULTIPLE_SPACES_PATTERN.sub(' ', text)
-    text = SPACE_BEFORE_INCH_PATTERN.sub(r'\1', text)
-    text = SPACE_BEFORE_PAREN_PATTERN.sub(')', text)
+    text = SPACE_BEFORE_CLOSER_PATTERN.sub(r'\1', text)
     return text.strip()
 
 
@@ -41,3 +42,21 @@ def extract_clean_url_from_style(style: str) -> str:
         url = match.group(1)
         return DPREVIEW_SIZE_PARAM_PATTERN.sub('', url)
     return ""
+
+
+def get_element_text(elem: Tag) -> str:
+    """Return the stripped text of an element.
+
+    Equivalent to ``elem.get_text(strip=True)``, but reads ``.string`` directly
+    when the element wraps a single text node, skipping the descendant walk.
+
+    Args:
+        elem: Element to read text from
+
+    Returns:
+        Stripped text content
+    """
+    string = elem.string
+    if type(string) is NavigableString:
+        return string.strip()
+    return elem.get_text(strip=True)
@@ -27,6 +27,8 @@ from dpreview_scraper.parsers.parse_utils import (
 )
 from dpreview_scraper.parsers.review_parser import extract_review_data
 from dpreview_scraper.parsers.specs_parser import (
+    CONTENT_TABLE_STRAINER,
+    SPECS_TABLE_STRAINER,
     extract_full_specs,
     extract_review_specs,
     merge_specs,
@@ -67,9 +69,14 @@ def parse_product_page(
         Camera object with all data
     """
     overview_soup = BeautifulSoup(overview_html, "lxml")
-    specs_soup = BeautifulSoup(specs_html, "lxml")
     review_soup = BeautifulSoup(review_html, "lxml") if review_html else None
-    review_specs_soup = BeautifulSoup(review_specs_html, "lxml") if review_specs_html else None
+    # Spec pages are only used for their tables; build just those subtrees
+    specs_soup = BeautifulSoup(specs_html, "lxml", parse_only=SPECS_TABLE_STRAINER)
+    review_specs_soup = (
+        BeautifulSoup(review_specs_html, "lxml", parse_only=CONTENT_TABLE_STRAINER)
+        if review_specs_html
+        else None
+    )
 
     # Extract top-level metadata from overview page
     name = extract_name(overview_soup)
@@ -1,18 +1,29 @@
 """Extract review data from overview and review pages."""
 
+import logging
 import re
 from typing import Optional
 
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from dpreview_scraper.models.review import ReviewData, ReviewSummary
-from dpreview_scraper.parsers.parse_utils import extract_clean_url_from_style
+from dpreview_scraper.parsers.parse_utils import (
+    extract_clean_url_from_style,
+    get_element_text,
+)
 from dpreview_scraper.utils.logging import logger
 
+# Phrases that mark community/blog content rather than a product description
+BLOG_CONTENT_PATTERN = re.compile(
+    r'\b(?:this month|challenge|share your|photo adventures)\b',
+    re.IGNORECASE,
+)
 
-def _extract_overview_summary(soup: BeautifulSoup) -> str:
-    """Extract summary/description from the overview page's description tab."""
-    selectors = [
+# Precompiled CSS selectors (selector text kept alongside for debug logging)
+OVERVIEW_SUMMARY_SELECTORS = [
+    (selector, sv.compile(selector))
+    for selector in [
         "div.productOverviewPage div.section p",
         "div#descriptionTab div.productBody",
         "div#description div.productBody",
@@ -27,30 +38,62 @@ def _extract_overview_summary(soup: BeautifulSoup) -> str:
         "div.pressRelease",
         "div.announcement",
     ]
-
-    blog_patterns = [
-        r'\bthis month\b',
-        r'\bchallenge\b',
-        r'\bshare your\b',
-        r'\bphoto adventures\b',
+]
+REVIEW_SUMMARY_SELECTORS = [
+    (selector, sv.compile(selector))
+    for selector in [
+        "div.mainContent div.article-intro",
+        "div.content div.article-intro",
+        "article div.article-intro",
+        "div.reviewIntro",
+        "div.review-intro",
+        "div.mainContent div.articleBody p:first-of-type",
+        "div.content div.articleBody p:first-of-type",
+        "article div.articleBody p:first-of-type",
+        "div.productDescription",
+        "div.product-description",
     ]
+]
+# Score selectors in priority order; candidates are gathered with one combined selector
+SCORE_SELECTOR_TEXTS = [
+    "span.overallScore",
+    "span.score",
+    "div.score",
+    "[data-score]",
+]
+SCORE_SELECTORS = [(selector, sv.compile(selector)) for selector in SCORE_SELECTOR_TEXTS]
+SCORE_CANDIDATE_SELECTOR = sv.compile(", ".join(SCORE_SELECTOR_TEXTS))
+SCORE_DIGITS_PATTERN = re.compile(r"(\d+)")
+REVIEW_SUMMARY_ROW_SELECTOR = sv.compile("tr.suitability, tr.summary")
+SUITABILITY_TEXT_SELECTOR = sv.compile("div.text")
+CONCLUSION_TEXT_SELECTOR = sv.compile("div.summary")
+PRODUCT_SHOT_SELECTOR = sv.compile("div.productShotThumbnail")
+AMAZON_PRODUCT_ID_SELECTOR = sv.compile("a.amazonAffiliate[data-product-id]")
+AMAZON_LINK_SELECTOR = sv.compile("a[href*='amazon.com']")
+JSON_LD_SELECTOR = sv.compile('script[type="application/ld+json"]')
+
 
-    for selector in selectors:
-        elem = soup.select_one(selector)
+def _extract_overview_summary(soup: BeautifulSoup) -> str:
+    """Extract summary/description from the overview page's description tab."""
+    # Per-selector tracing is only formatted when debug logging is on
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    for selector, compiled in OVERVIEW_SUMMARY_SELECTORS:
+        elem = compiled.select_one(soup)
         if elem:
             text = elem.get_text(separator=' ', strip=True)
-            logger.debug(f"Selector '{selector}' matched element with {len(text)} chars")
+            if debug:
+                logger.debug(f"Selector '{selector}' matched element with {len(text)} chars")
             if text and len(text) > 100:
-                text_lower = text.lower()
-                if any(re.search(pattern, text_lower) for pattern in blog_patterns):
+                if BLOG_CONTENT_PATTERN.search(text):
                     logger.debug(f"Skipping blog-like content from selector: {selector}")
                     continue
 
                 logger.debug(f"Found executive summary from overview page with selector: {selector}")
                 return text
-            elif text:
+            elif text and debug:
                 logger.debug(f"Text too short ({len(text)} chars): {text[:50]}...")
-        else:
+        elif debug:
             logger.debug(f"Selector '{selector}' found no match")
 
     logger.warning("No executive summary found with any selector")
@@ -69,73 +112,52 @@ def _parse_review_page(soup: BeautifulSoup) -> tuple[str, ReviewSummary, int]:
     conclusion = ""
     review_score = 0
 
-    summary_selectors = [
-        "div.mainContent div.article-intro",
-        "div.content div.article-intro",
-        "article div.article-intro",
-        "div.reviewIntro",
-        "div.review-intro",
-        "div.mainContent div.articleBody p:first-of-type",
-        "div.content div.articleBody p:first-of-type",
-        "article div.articleBody p:first-of-type",
-        "div.productDescription",
-        "div.product-description",
-    ]
-
-    blog_patterns = [
-        r'\bthis month\b',
-        r'\bchallenge\b',
-        r'\bshare your\b',
-        r'\bphoto adventures\b',
-    ]
-
-    for selector in summary_selectors:
-        elem = soup.select_one(selector)
+    for selector, compiled in REVIEW_SUMMARY_SELECTORS:
+        elem = compiled.select_one(soup)
         if elem:
-            text = elem.get_text(strip=True)
+            text = get_element_text(elem)
             if text and len(text) > 50:
-                text_lower = text.lower()
-                if any(re.search(pattern, text_lower) for pattern in blog_patterns):
+                if BLOG_CONTENT_PATTERN.search(text):
                     logger.debug(f"Skipping blog-like content from selector: {selector}")
                     continue
                 executive_summary = text
                 logger.debug(f"Found executive summary with selector: {selector}")
                 break
 
-    score_selectors = [
-        "span.overallScore",
-        "span.score",
-        "div.score",
-        "[data-score]",
-    ]
-
-    for selector in score_selectors:
-        elem = soup.select_one(selector)
+    # One walk collects every score candidate; each selector then takes its first match
+    score_candidates = SCORE_CANDIDATE_SELECTOR.select(soup)
+    for selector, compiled in SCORE_SELECTORS:
+        elem = next((c for c in score_candidates if compiled.match(c)), None)
         if elem:
-            score_text = elem.get_text(strip=True)
-            data_score = elem.get("data-score")
-            score_value = data_score or score_text
-            if score_value:
-                try:
-                    score_match = re.search(r"(\d+)", score_value)
-                    if score_match:
-                        review_score = int(score_match.group(1))
-                        logger.debug(f"Found review score: {review_score} with selector: {selector}")
-                        break
-                except (ValueError, AttributeError):
-                    continue
+            score_value = elem.get("data-score") or get_element_text(elem)
+            score_match = SCORE_DIGITS_PATTERN.search(score_value)
+            if score_match:
+                review_score = int(score_match.group(1))
+                logger.debug(f"Found review score: {review_score} with selector: {selector}")
+                break
+
+    # Pros, cons and conclusion rows share one table; collect them in a single walk
+    good_for_elem = None
+    not_good_elem = None
+    conclusion_elem = None
+    for row in REVIEW_SUMMARY_ROW_SELECTOR.select(soup):
+        classes = row.get("class", [])
+        if "suitability" in classes:
+            if good_for_elem is None and "goodFor" in classes:
+                good_for_elem = SUITABILITY_TEXT_SELECTOR.select_one(row)
+            if not_good_elem is None and "notGoodFor" in classes:
+                not_good_elem = SUITABILITY_TEXT_SELECTOR.select_one(row)
+        if conclusion_elem is None and "summary" in classes:
+            conclusion_elem = CONCLUSION_TEXT_SELECTOR.select_one(row)
 
-    good_for_elem = soup.select_one("tr.suitability.goodFor div.text")
     if good_for_elem:
-        good_for = good_for_elem.get_text(strip=True)
+        good_for = get_element_text(good_for_elem)
 
-    not_good_elem = soup.select_one("tr.suitability.notGoodFor div.text")
     if not_good_elem:
-        not_so_good_for = not_good_elem.get_text(strip=True)
+        not_so_good_for = get_element_text(not_good_elem)
 
-    conclusion_elem = soup.select_one("tr.summary div.summary")
     if conclusion_elem:
-        conclusion = conclusion_elem.get_text(strip=True)
+        conclusion = get_element_text(conclusion_elem)
 
     review_summary = ReviewSummary(
         GoodFor=good_for,
@@ -162,7 +184,7 @@ def extract_review_data(
     review_score = 0
 
     # Product photos from thumbnail gallery
-    thumbnails = overview_soup.select("div.productShotThumbnail")
+    thumbnails = PRODUCT_SHOT_SELECTOR.select(overview_soup)
     if thumbnails:
         photos = []
         for thumb in thumbnails:
@@ -174,14 +196,14 @@ def extract_review_data(
 
     # ASIN (Amazon product IDs)
     asins = []
-    amazon_links = overview_soup.select("a.amazonAffiliate[data-product-id]")
+    amazon_links = AMAZON_PRODUCT_ID_SELECTOR.select(overview_soup)
     for link in amazon_links:
         asin = link.get("data-product-id")
         if asin:
             asins.append(asin)
 
     if not asins:
-        amazon_links = overview_soup.select("a[href*='amazon.com']")
+        amazon_links = AMAZON_LINK_SELECTOR.select(overview_soup)
         for link in amazon_links:
             href = link.get("href", "")
             match = re.search(r"/dp/([A-Z0-9]{10})", href)
@@ -214,7 +236,7 @@ def extract_review_data(
 
     # Try JSON-LD for review score
     if review_score == 0:
-        json_ld = overview_soup.select_one('script[type="application/ld+json"]')
+        json_ld = JSON_LD_SELECTOR.select_one(overview_soup)
         if json_ld:
             try:
                 import json
@@ -2,37 +2,42 @@
 
 import re
 from typing import List
-from bs4 import BeautifulSoup
+from urllib.parse import urljoin
 
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+
+from dpreview_scraper.config import settings
 from dpreview_scraper.models.camera import SearchResult
+from dpreview_scraper.parsers.parse_utils import get_element_text, normalize_whitespace
 from dpreview_scraper.utils.logging import logger
 
-# Precompiled regex for whitespace normalization
-MULTIPLE_SPACES_PATTERN = re.compile(r'\s+')
-# Pattern to remove spaces before inch/quote symbols
-SPACE_BEFORE_INCH_PATTERN = re.compile(r'\s+(″|"|\'\'|")')
-# Pattern to remove spaces before closing parentheses
-SPACE_BEFORE_PAREN_PATTERN = re.compile(r'\s+\)')
+# Pattern to extract the page number from a pagination URL query string
+PAGE_PARAM_PATTERN = re.compile(r'[?&]page=(\d+)')
 
+# Precompiled CSS selectors
+PRODUCT_ROW_SELECTOR = sv.compile("tr.product")
+NAME_LINK_SELECTOR = sv.compile("td.info div.name a")
+IMAGE_SELECTOR = sv.compile("td.product div.productImage a img")
+ANNOUNCEMENT_DATE_SELECTOR = sv.compile("td.info div.announcementDate")
+SHORT_SPECS_SELECTOR = sv.compile("td.info div.specs div.shortProductSpecs")
+REVIEW_LINK_SELECTOR = sv.compile('td.review a[href*="/reviews/"]')
+NEXT_LINK_SELECTOR = sv.compile('link[rel="next"]')
+PAGINATION_SELECTOR = sv.compile("table.pager, table.pages")
+CURRENT_PAGE_SELECTOR = sv.compile(".active, .current, [aria-current='page']")
+PAGE_LINK_SELECTOR = sv.compile("a")
 
-def _normalize_whitespace(text: str) -> str:
-    """Normalize whitespace in text by collapsing multiple spaces to single space.
 
-    Also removes spaces before inch symbols (″) and closing parentheses.
+def _is_product_row_class(class_value: str | None) -> bool:
+    """Check whether a raw class attribute marks a product row (e.g. "product last")."""
+    return class_value is not None and "product" in class_value.split()
 
-    Args:
-        text: Text to normalize
 
-    Returns:
-        Text with normalized whitespace
-    """
-    # First collapse multiple spaces
-    text = MULTIPLE_SPACES_PATTERN.sub(' ', text)
-    # Remove spaces before inch/quote symbols
-    text = SPACE_BEFORE_INCH_PATTERN.sub(r'\1', text)
-    # Remove spaces before closing parentheses
-    text = SPACE_BEFORE_PAREN_PATTERN.sub(')', text)
-    return text.strip()
+# Only build tree nodes for product rows; the rest of the listing page is discarded
+PRODUCT_ROW_STRAINER = SoupStrainer("tr", class_=_is_product_row_class)
+
+# Shared with the product parser
+_normalize_whitespace = normalize_whitespace
 
 
 def parse_search_results(html: str) -> List[SearchResult]:
@@ -44,82 +49,79 @@ def parse_search_results(html: str) -> List[SearchResult]:
     Returns:
         List of search results
     """
-    soup = BeautifulSoup(html, "lxml")
+    soup = BeautifulSoup(html, "lxml", parse_only=PRODUCT_ROW_STRAINER)
     results = []
 
     # Find product rows in the table
     # Structure: <tr id="product_[code]" class="product">
-    product_elements = soup.select("tr.product")
+    product_elements = PRODUCT_ROW_SELECTOR.select(soup)
 
     if not product_elements:
         logger.warning("No product elements found in search results")
         return results
 
     for element in product_elements:
-        try:
-            # Extract product code from id attribute (e.g., "product_sony_a7v")
-            product_id = element.get("id", "")
-            if product_id.startswith("product_"):
-                product_code = product_id.replace("product_", "")
-            else:
-                # Fallback: extract from URL
-                link = element.select_one("td.info div.name a")
-                if not link:
-                    continue
-                url = link.get("href", "")
-                if not url:
-                    continue
-                parts = url.strip("/").split("/")
-                if len(parts) < 3:
-                    continue
-                product_code = parts[-1]
-
-            # Extract URL from name link
-            link = element.select_one("td.info div.name a")
-            if not link:
-                continue
-
-            url = link.get("href", "")
-            if not url:
-                continue
+        # Name link carries both the product URL and the display name
+        link = NAME_LINK_SELECTOR.select_one(element)
+        if link is None:
+            continue
 
-            # Extract name
-            name = link.get_text(strip=True)
-
-            # Extract image
-            img = element.select_one("td.product div.productImage a img")
-            image_url = img.get("src", "") if img else ""
-
-            # Extract announcement date
-            announced = None
-            date_elem = element.select_one("td.info div.announcementDate")
-            if date_elem:
-                announced = date_elem.get_text(strip=True)
-
-            # Extract short specs (pipe-separated list)
-            short_specs = []
-            short_specs_elem = element.select_one("td.info div.specs div.shortProductSpecs")
-            if short_specs_elem:
-                # Get text content, preserving special characters
-                specs_text = short_specs_elem.get_text(separator=' ', strip=True)
-                # Split by pipe and clean up each spec, normalizing whitespace
-                short_specs = [_normalize_whitespace(spec) for spec in specs_text.split("|") if spec.strip()]
-
-            result = SearchResult(
-                product_code=product_code,
-                name=name,
-                url=url,
-                image_url=image_url,
-                announced=announced,
-                short_specs=short_specs,
-            )
-            results.append(result)
-            logger.debug(f"Parsed search result: {product_code}")
-
-        except Exception as e:
-            logger.warning(f"Failed to parse search result: {e}")
+        url = link.get("href", "")
+        if not url:
             continue
 
+        # Extract product code from id attribute (e.g., "product_sony_a7v")
+        product_id = element.get("id", "")
+        if product_id.startswith("product_"):
+            product_code = product_id.replace("product_", "")
+        else:
+            # Fallback: extract from URL
+            parts = url.strip("/").split("/")
+            if len(parts) < 3:
+                continue
+            product_code = parts[-1]
+
+        # Extract name
+        name = get_element_text(link)
+
+        # Extract image
+        img = IMAGE_SELECTOR.select_one(element)
+        image_url = img.get("src", "") if img is not None else ""
+
+        # Extract announcement date
+        announced = None
+        date_elem = ANNOUNCEMENT_DATE_SELECTOR.select_one(element)
+        if date_elem is not None:
+            announced = get_element_text(date_elem)
+
+        # Extract short specs (pipe-separated list)
+        short_specs = []
+        short_specs_elem = SHORT_SPECS_SELECTOR.select_one(element)
+        if short_specs_elem is not None:
+            # Get text content, preserving special characters
+            specs_text = short_specs_elem.get_text(separator=' ', strip=True)
+            # Split by pipe and clean up each spec, normalizing whitespace
+            short_specs = [_normalize_whitespace(spec) for spec in specs_text.split("|") if spec.strip()]
+
+        # Reviewed products show their award/score badge linking to the review;
+        # the href is usually relative, and the browser needs an absolute URL
+        review_url = None
+        review_link = REVIEW_LINK_SELECTOR.select_one(element)
+        if review_link is not None and review_link.get("href"):
+            review_url = urljoin(settings.base_url, review_link["href"])
+
+        result = SearchResult(
+            product_code=product_code,
+            name=name,
+            url=url,
+            image_url=image_url,
+            announced=announced,
+            short_specs=short_specs,
+            review_url=review_url,
+        )
+        results.append(result)
+        logger.debug(f"Parsed search result: {product_code}")
+
     logger.info(f"Parsed {len(results)} search results")
     return results
 
@@ -143,40 +145,33 @@ def extract_pagination_info(html: str) -> dict:
 
     try:
         # Check for next page link in HTML head
-        next_link = soup.select_one('link[rel="next"]')
+        next_link = NEXT_LINK_SELECTOR.select_one(soup)
         if next_link:
             info["has_next"] = True
             next_href = next_link.get("href", "")
             # Try to extract page number from URL
-            if "page=" in next_href:
-                try:
-                    page_param = next_href.split("page=")[1].split("&")[0]
-                    next_page = int(page_param)
-                    info["current_page"] = next_page - 1
-                except (ValueError, IndexError):
-                    pass
+            page_match = PAGE_PARAM_PATTERN.search(next_href)
+            if page_match:
+                info["current_page"] = int(page_match.group(1)) - 1
 
         # Look for pagination in table.pager or table.pages
-        pagination = soup.select_one("table.pager, table.pages")
+        pagination = PAGINATION_SELECTOR.select_one(soup)
         if pagination:
             # Current page
-            current = pagination.select_one(".active, .current, [aria-current='page']")
+            current = CURRENT_PAGE_SELECTOR.select_one(pagination)
             if current:
-                try:
-                    info["current_page"] = int(current.get_text(strip=True))
-                except ValueError:
-                    pass
+                current_text = get_element_text(current)
+                if current_text.isdecimal():
+                    info["current_page"] = int(current_text)
 
             # Total pages from page links
-            page_links = pagination.select("a")
+            page_links = PAGE_LINK_SELECTOR.select(pagination)
             if page_links:
                 page_numbers = []
                 for link in page_links:
-                    try:
-                        num = int(link.get_text(strip=True))
-                        page_numbers.append(num)
-                    except ValueError:
-                        continue
+                    link_text = get_element_text(link)
+                    if link_text.isdecimal():
+                        page_numbers.append(int(link_text))
                 if page_numbers:
                     info["total_pages"] = max(page_numbers)
 
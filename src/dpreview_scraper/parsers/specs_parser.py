@@ -1,22 +1,57 @@
 """Extract technical specifications from product and review pages."""
 
+import logging
 import re
+from functools import lru_cache
 from typing import List, Optional
 
-from bs4 import BeautifulSoup, Tag
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from dpreview_scraper.models.specs import CameraSpecs
-from dpreview_scraper.parsers.parse_utils import normalize_whitespace
+from dpreview_scraper.parsers.parse_utils import get_element_text, normalize_whitespace
 from dpreview_scraper.utils.logging import logger
 
 ANNOUNCED_PREFIX_PATTERN = re.compile(r'^Announced\s+')
 
+# Precompiled CSS selectors
+SPECS_TABLE_SELECTOR = sv.compile("table.specsTable.compact")
+SPECS_TABLE_ROW_SELECTOR = sv.compile("tbody tr")
+CONTENT_TABLE_SELECTOR = sv.compile("table.contentTable")
+CONTENT_TABLE_ROW_SELECTOR = sv.compile("table.contentTable tr")
+TH_SELECTOR = sv.compile("th")
+TD_SELECTOR = sv.compile("td")
+TH_LABEL_SELECTOR = sv.compile("th.label")
+TD_VALUE_SELECTOR = sv.compile("td.value")
+
+
+def _is_specs_table_class(class_value: str | None) -> bool:
+    """Check whether a raw class attribute marks a specs table (e.g. "specsTable compact")."""
+    return class_value is not None and "specsTable" in class_value.split()
+
+
+def _is_content_table_class(class_value: str | None) -> bool:
+    """Check whether a raw class attribute marks a review content table."""
+    return class_value is not None and "contentTable" in class_value.split()
+
+
+# Spec pages are only read for their tables, so callers can skip building the rest
+SPECS_TABLE_STRAINER = SoupStrainer("table", class_=_is_specs_table_class)
+CONTENT_TABLE_STRAINER = SoupStrainer("table", class_=_is_content_table_class)
+
 # Fields that should be parsed as lists
 LIST_SPEC_FIELDS = frozenset({
     "Autofocus", "ExposureModes", "MeteringModes",
     "FileFormat", "Modes", "DriveModes"
 })
 
+# CameraSpecs field names, resolved once for merge_specs
+CAMERA_SPECS_FIELDS = tuple(CameraSpecs.model_fields)
+
+# Separators for text list values, in priority order (newlines are already
+# collapsed by normalize_whitespace, so they never survive to the split)
+LIST_VALUE_SEPARATORS = (";", ",")
+
 # Mapping of HTML label text -> CameraSpecs field name
 SPEC_LABEL_MAPPING = {
     # Dates & Pricing
@@ -189,9 +224,12 @@ SPEC_LABEL_MAPPING = {
 }
 
 
+@lru_cache(maxsize=1024)
 def normalize_spec_name(label: str) -> Optional[str]:
     """Normalize spec label to CameraSpecs field name.
 
+    Cached because the same few hundred labels repeat on every specs page.
+
     Args:
         label: HTML label text (e.g., "Body type", "Sensor size")
 
@@ -216,31 +254,32 @@ def parse_list_value(elem: Tag) -> List[str]:
                 items.append(text)
     else:
         text = normalize_whitespace(elem.get_text(separator=' ', strip=True))
-        for sep in ["\n", ";", ","]:
+        for sep in LIST_VALUE_SEPARATORS:
             if sep in text:
-                parts = [normalize_whitespace(p) for p in text.split(sep) if p.strip()]
+                # text is already normalized, so each part only needs trimming
+                parts = [part for p in text.split(sep) if (part := p.strip())]
                 if len(parts) > 1:
                     return parts
 
-        if text.strip():
-            items.append(text.strip())
+        if text:
+            items.append(text)
 
     return items
 
 
 def _parse_spec_row(
     row: Tag,
-    label_selector: str,
-    value_selector: str
+    label_selector: sv.SoupSieve,
+    value_selector: sv.SoupSieve,
 ) -> Optional[tuple[str, str | list]]:
     """Parse a single spec row, returning (field_name, value) or None."""
-    label_elem = row.select_one(label_selector)
-    value_elem = row.select_one(value_selector)
+    label_elem = label_selector.select_one(row)
+    value_elem = value_selector.select_one(row)
 
     if not label_elem or not value_elem:
         return None
 
-    label = label_elem.get_text(strip=True).replace(":", "")
+    label = get_element_text(label_elem).replace(":", "")
     value = normalize_whitespace(value_elem.get_text(separator=' ', strip=True))
 
     if not value:
@@ -248,11 +287,17 @@ def _parse_spec_row(
 
     field_name = normalize_spec_name(label)
     if not field_name:
-        logger.debug(f"UNMAPPED LABEL: '{label}' = '{value[:50] if len(value) > 50 else value}'")
+        # Unmapped labels are common, so only format the trace when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"UNMAPPED LABEL: '{label}' = '{value[:50]}'")
         return None
 
     if field_name in LIST_SPEC_FIELDS:
-        return (field_name, parse_list_value(value_elem))
+        try:
+            return (field_name, parse_list_value(value_elem))
+        except Exception as e:
+            logger.debug(f"Failed to parse list value for {field_name}: {e}")
+            return None
 
     if field_name == "Announced":
         value = ANNOUNCED_PREFIX_PATTERN.sub('', value)
@@ -260,72 +305,61 @@ def _parse_spec_row(
     return (field_name, value)
 
 
+def _collect_spec_rows(
+    rows: List[Tag],
+    label_selector: sv.SoupSieve,
+    value_selector: sv.SoupSieve,
+) -> dict[str, str | list]:
+    """Parse spec rows into a field -> value dict (later rows win).
+
+    _parse_spec_row returns None for malformed rows, so no per-row exception
+    handling is needed here.
+    """
+    specs_dict: dict[str, str | list] = {}
+
+    for row in rows:
+        result = _parse_spec_row(row, label_selector, value_selector)
+        if result:
+            field_name, value = result
+            specs_dict[field_name] = value
+
+    return specs_dict
+
+
 def extract_review_specs(soup: BeautifulSoup) -> CameraSpecs:
     """Extract specs from review page 2 (table.contentTable).
 
     Review specs pages have more comprehensive data than the regular specs page.
     """
-    specs_dict: dict[str, str | list] = {}
-
-    content_tables = soup.select("table.contentTable")
-    if not content_tables:
+    # All rows of every content table, gathered in one document walk
+    rows = CONTENT_TABLE_ROW_SELECTOR.select(soup)
+    if not rows and CONTENT_TABLE_SELECTOR.select_one(soup) is None:
         logger.warning("No contentTable found on review specs page")
-        return CameraSpecs(**specs_dict)
-
-    for table in content_tables:
-        rows = table.select("tr")
-        for row in rows:
-            try:
-                result = _parse_spec_row(row, "th", "td")
-                if result:
-                    field_name, value = result
-                    specs_dict[field_name] = value
-            except Exception as e:
-                logger.debug(f"Failed to parse review spec row: {e}")
-                continue
+        return CameraSpecs()
 
-    return CameraSpecs(**specs_dict)
+    return CameraSpecs(**_collect_spec_rows(rows, TH_SELECTOR, TD_SELECTOR))
 
 
 def merge_specs(primary: CameraSpecs, secondary: CameraSpecs) -> CameraSpecs:
     """Merge two CameraSpecs, using primary values and filling gaps from secondary."""
-    merged_dict = {}
-
-    for field_name in primary.model_fields:
-        primary_value = getattr(primary, field_name)
-        secondary_value = getattr(secondary, field_name)
+    primary_values = primary.__dict__
+    secondary_values = secondary.__dict__
 
-        if primary_value:
-            if isinstance(primary_value, list):
-                merged_dict[field_name] = primary_value if primary_value else secondary_value
-            else:
-                merged_dict[field_name] = primary_value
-        else:
-            merged_dict[field_name] = secondary_value
+    merged_dict = {
+        field_name: primary_values[field_name] or secondary_values[field_name]
+        for field_name in CAMERA_SPECS_FIELDS
+    }
 
-    return CameraSpecs(**merged_dict)
+    # Both inputs are already validated CameraSpecs, so skip re-validation
+    return CameraSpecs.model_construct(**merged_dict)
 
 
 def extract_full_specs(soup: BeautifulSoup) -> CameraSpecs:
     """Extract all technical specifications from full specifications page."""
-    specs_dict: dict[str, str | list] = {}
-
-    specs_table = soup.select_one("table.specsTable.compact")
+    specs_table = SPECS_TABLE_SELECTOR.select_one(soup)
     if not specs_table:
         logger.warning("No specifications table found")
-        return CameraSpecs(**specs_dict)
-
-    tbody_sections = specs_table.select("tbody")
-    for tbody in tbody_sections:
-        rows = tbody.select("tr")
-        for row in rows:
-            try:
-                result = _parse_spec_row(row, "th.label", "td.value")
-                if result:
-                    field_name, value = result
-                    specs_dict[field_name] = value
-            except Exception as e:
-                logger.debug(f"Failed to parse spec row: {e}")
-                continue
-
-    return CameraSpecs(**specs_dict)
+        return CameraSpecs()
+
+    rows = SPECS_TABLE_ROW_SELECTOR.select(specs_table)
+    return CameraSpecs(**_collect_spec_rows(rows, TH_LABEL_SELECTOR, TD_VALUE_SELECTOR))
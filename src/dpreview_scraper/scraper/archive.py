@@ -1,14 +1,15 @@
 """Wayback Machine archive integration."""
 
-from typing import Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 import asyncio
 import time
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from dpreview_scraper.config import settings
 from dpreview_scraper.utils.logging import logger
 
+T = TypeVar("T")
+
 
 class ArchiveManager:
     """Manage Wayback Machine archive URLs."""
@@ -19,19 +20,71 @@ class ArchiveManager:
     # Rate limiting: minimum seconds between archive creation requests
     SAVE_REQUEST_DELAY = 5.0
 
-    def __init__(self):
-        """Initialize archive manager."""
-        self.client = httpx.AsyncClient(timeout=30.0)
+    # Retry backoff for transient HTTP errors: 2s, 2s, 4s, ... capped at 10s
+    RETRY_MIN_WAIT = 2.0
+    RETRY_MAX_WAIT = 10.0
+
+    # Seconds an availability lookup result stays valid in the in-process cache
+    AVAILABILITY_CACHE_TTL = 24 * 60 * 60
+
+    # Maximum in-flight availability lookups for batched requests
+    LOOKUP_CONCURRENCY = 10
+
+    # Keep-alive pool sized for concurrent lookups against archive.org
+    CONNECTION_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """Initialize archive manager.
+
+        Args:
+            client: Optional shared HTTP client. If None, the manager creates
+                (and closes) its own pooled client.
+        """
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            timeout=30.0,
+            limits=self.CONNECTION_LIMITS,
+            headers={"User-Agent": settings.user_agent},
+        )
         self._last_save_time: Optional[float] = None
+        # url -> (monotonic lookup time, archive URL or None)
+        self._availability_cache: Dict[str, Tuple[float, Optional[str]]] = {}
 
     async def close(self) -> None:
-        """Close HTTP client."""
-        await self.client.aclose()
+        """Close HTTP client if this manager created it."""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def _with_retries(self, request: Callable[[], Awaitable[T]], attempts: int) -> T:
+        """Run an HTTP request, retrying transient failures with exponential backoff.
+
+        Args:
+            request: Zero-argument coroutine function performing the request
+            attempts: Maximum number of attempts
+
+        Returns:
+            Result of the first successful attempt
+        """
+        for attempt in range(1, attempts):
+            try:
+                return await request()
+            except httpx.HTTPError as e:
+                wait_time = min(self.RETRY_MAX_WAIT, max(self.RETRY_MIN_WAIT, 2.0 ** (attempt - 1)))
+                logger.debug(f"Archive request failed ({e}), retrying in {wait_time:.0f}s")
+                await asyncio.sleep(wait_time)
+
+        # Final attempt: let the error propagate to the caller
+        return await request()
+
+    async def _fetch_availability(self, url: str) -> httpx.Response:
+        """Query the availability API once, raising on HTTP error status."""
+        response = await self.client.get(
+            self.WAYBACK_AVAILABILITY_API,
+            params={"url": url},
+        )
+        response.raise_for_status()
+        return response
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
     async def get_archive_url(self, url: str) -> Optional[str]:
         """Get Wayback Machine archive URL for a page.
 
@@ -44,14 +97,17 @@ class ArchiveManager:
         if not url.startswith("http"):
             url = f"{settings.base_url}{url}"
 
+        cached = self._availability_cache.get(url)
+        if cached and time.monotonic() - cached[0] < self.AVAILABILITY_CACHE_TTL:
+            logger.debug(f"Using cached Wayback Machine result for: {url}")
+            return cached[1]
+
         try:
             logger.debug(f"Checking Wayback Machine for: {url}")
 
-            response = await self.client.get(
-                self.WAYBACK_AVAILABILITY_API,
-                params={"url": url},
+            response = await self._with_retries(
+                lambda: self._fetch_availability(url), attempts=3
             )
-            response.raise_for_status()
 
             data = response.json()
             archived_snapshots = data.get("archived_snapshots", {})
@@ -60,19 +116,37 @@ class ArchiveManager:
             if closest and closest.get("available"):
                 archive_url = closest.get("url")
                 logger.info(f"Found archive URL: {archive_url}")
+                self._availability_cache[url] = (time.monotonic(), archive_url)
                 return archive_url
 
             logger.debug(f"No archive found for: {url}")
+            self._availability_cache[url] = (time.monotonic(), None)
             return None
 
         except Exception as e:
             logger.warning(f"Failed to check archive for {url}: {e}")
             return None
 
-    @retry(
-        stop=stop_after_attempt(2),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
+    async def get_archive_urls(
+        self, urls: List[str], concurrency: int = LOOKUP_CONCURRENCY
+    ) -> List[Optional[str]]:
+        """Get Wayback Machine archive URLs for several pages concurrently.
+
+        Args:
+            urls: URLs to look up
+            concurrency: Maximum number of lookups in flight at once
+
+        Returns:
+            Archive URL (or None) for each input URL, in the same order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _lookup(url: str) -> Optional[str]:
+            async with semaphore:
+                return await self.get_archive_url(url)
+
+        return await asyncio.gather(*(_lookup(url) for url in urls))
+
     async def save_to_archive(self, url: str) -> Optional[str]:
         """Request Wayback Machine to archive a URL.
 
@@ -99,15 +173,16 @@ class ArchiveManager:
             # Update last save time before making request
             self._last_save_time = time.time()
 
-            response = await self.client.get(
-                f"{self.WAYBACK_SAVE_API}/{url}",
-                follow_redirects=True,
+            response = await self._with_retries(
+                lambda: self.client.get(f"{self.WAYBACK_SAVE_API}/{url}", follow_redirects=True),
+                attempts=2,
             )
 
             if response.status_code == 200:
                 # Archive URL is in the final redirected URL
                 archive_url = str(response.url)
                 logger.info(f"Archived successfully: {archive_url}")
+                self._availability_cache[url] = (time.monotonic(), archive_url)
                 return archive_url
             elif response.status_code == 429:
                 logger.warning(f"Rate limited by Wayback Machine (429). Consider increasing SAVE_REQUEST_DELAY.")
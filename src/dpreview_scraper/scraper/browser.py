@@ -1,13 +1,73 @@
 """Playwright browser management."""
 
+import asyncio
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import AsyncIterator, Optional
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from urllib.parse import urlsplit
+from playwright.async_api import Browser, BrowserContext, Page, Route, async_playwright
 from playwright_stealth.stealth import Stealth
 
 from dpreview_scraper.config import settings
 from dpreview_scraper.utils.logging import logger
 
+# Stealth patches are stateless, so one instance serves every page
+STEALTH = Stealth()
+
+# Init script that hides navigator.webdriver from page scripts
+WEBDRIVER_MASK_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+
+# Headers sent with every request from a browser context
+DEFAULT_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Cache-Control": "max-age=0",
+}
+
+# Subresource types the scraper never reads; stylesheets stay allowed because
+# clicking the cookie-banner button needs it laid out and visible (actionable)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Analytics/ad hosts whose scripts and beacons only slow page loads down
+# (Cloudflare's challenge hosts must never be listed here)
+BLOCKED_HOST_SUFFIXES = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "amazon-adsystem.com",
+    "scorecardresearch.com",
+    "hotjar.com",
+    "clarity.ms",
+    "quantserve.com",
+    "quantcount.com",
+    "parsely.com",
+    "facebook.net",
+    "redditstatic.com",
+)
+
+
+def _is_blocked_host(url: str) -> bool:
+    """Check whether a request URL points at a known analytics/ad host."""
+    host = urlsplit(url).hostname or ""
+    return any(host == suffix or host.endswith(f".{suffix}") for suffix in BLOCKED_HOST_SUFFIXES)
+
+
+async def _block_unneeded_resources(route: Route) -> None:
+    """Abort heavy subresources and tracker requests; let everything else through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or _is_blocked_host(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class BrowserManager:
     """Manages Playwright browser instances with anti-detection measures."""
@@ -21,6 +81,15 @@ class BrowserManager:
         self.headless = headless
         self._browser: Optional[Browser] = None
         self._playwright = None
+        self._shared_context: Optional[BrowserContext] = None
+        self._shared_pages_opened = 0  # Pages opened on the current shared context
+        # Open page counts per shared context, so a rotated-out context is only
+        # closed once the last page using it is done
+        self._open_pages: dict[BrowserContext, int] = {}
+        self._retired_contexts: set[BrowserContext] = set()
+        self._storage_state_lock = asyncio.Lock()
+        # Pages are opened concurrently, so the lazy shared-context init must be serialized
+        self._context_lock = asyncio.Lock()
 
     async def start(self) -> None:
         """Start the browser."""
@@ -42,6 +111,17 @@ class BrowserManager:
 
     async def stop(self) -> None:
         """Stop the browser."""
+        if self._shared_context:
+            # Save cookies/local storage so the next run starts with a warm profile
+            await self.save_storage_state()
+            await self._shared_context.close()
+            self._shared_context = None
+
+        for context in self._retired_contexts:
+            await context.close()
+        self._retired_contexts.clear()
+        self._open_pages.clear()
+
         if self._browser:
             logger.info("Stopping browser...")
             await self._browser.close()
@@ -51,42 +131,116 @@ class BrowserManager:
             await self._playwright.stop()
             self._playwright = None
 
-    @asynccontextmanager
-    async def new_context(self) -> AsyncIterator[BrowserContext]:
-        """Create a new browser context with anti-detection headers.
+    async def save_storage_state(self) -> None:
+        """Write the shared context's cookies and local storage to disk.
 
-        Yields:
-            Browser context
+        Called after a Cloudflare challenge is cleared so the clearance cookie
+        survives even if the run is interrupted.
+        """
+        if not self._shared_context:
+            return
+
+        async with self._storage_state_lock:
+            try:
+                await self._shared_context.storage_state(path=settings.storage_state_file)
+            except Exception as e:
+                logger.warning(f"Failed to save browser storage state: {e}")
+
+    async def _create_context(self, storage_state: Optional[Path] = None) -> BrowserContext:
+        """Create a browser context with anti-detection headers.
+
+        Args:
+            storage_state: Optional saved storage state (cookies, local storage) to restore
         """
         if not self._browser:
             await self.start()
 
         context = await self._browser.new_context(
+            storage_state=storage_state,
             user_agent=settings.user_agent,
             viewport={"width": 1920, "height": 1080},
             locale="en-US",
             timezone_id="America/New_York",
-            extra_http_headers={
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Site": "none",
-                "Cache-Control": "max-age=0",
-            },
+            extra_http_headers=DEFAULT_HEADERS,
         )
 
         # Add JavaScript to mask automation
-        await context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
+        await context.add_init_script(WEBDRIVER_MASK_SCRIPT)
+
+        # Only the HTML is parsed, so skip downloading heavy subresources
+        await context.route("**/*", _block_unneeded_resources)
+
+        return context
 
+    def _rotation_due(self) -> bool:
+        """Check whether the shared context has served enough pages to be replaced."""
+        limit = settings.context_rotation_pages
+        return limit > 0 and self._shared_pages_opened >= limit
+
+    async def _retire_shared_context(self) -> None:
+        """Swap out the shared context, carrying its cookies over via the storage state file.
+
+        Long-lived contexts keep growing in memory, so they are replaced
+        periodically. Pages still open on the old context keep working; it is
+        closed when the last of them closes.
+        """
+        logger.debug(f"Rotating browser context after {self._shared_pages_opened} pages")
+        await self.save_storage_state()
+
+        context = self._shared_context
+        self._shared_context = None
+        self._shared_pages_opened = 0
+        if self._open_pages.get(context, 0):
+            self._retired_contexts.add(context)
+        else:
+            self._open_pages.pop(context, None)
+            await context.close()
+
+    async def _release_shared_page(self, context: BrowserContext) -> None:
+        """Record a closed shared-context page, closing its context if it was retired."""
+        self._open_pages[context] -= 1
+        if self._open_pages[context] == 0 and context in self._retired_contexts:
+            del self._open_pages[context]
+            self._retired_contexts.discard(context)
+            await context.close()
+
+    async def _get_shared_context(self) -> BrowserContext:
+        """Get the session-wide context, creating it on first use.
+
+        The context is recreated every ``settings.context_rotation_pages`` pages.
+
+        Returns:
+            Browser context shared by all pages opened without an explicit context
+        """
+        if self._shared_context and not self._rotation_due():
+            return self._shared_context
+
+        async with self._context_lock:
+            # Another caller may have created or rotated it while we waited for the lock
+            if self._shared_context and self._rotation_due():
+                await self._retire_shared_context()
+
+            if not self._shared_context:
+                storage_state = settings.storage_state_file
+                if storage_state.exists():
+                    try:
+                        self._shared_context = await self._create_context(storage_state)
+                        logger.debug(f"Restored browser storage state from {storage_state}")
+                    except Exception as e:
+                        logger.warning(f"Ignoring unreadable browser storage state: {e}")
+
+                if not self._shared_context:
+                    self._shared_context = await self._create_context()
+        return self._shared_context
+
+    @asynccontextmanager
+    async def new_context(self) -> AsyncIterator[BrowserContext]:
+        """Create a new, isolated browser context with anti-detection headers.
+
+        Yields:
+            Browser context
+        """
+        context = await self._create_context()
         try:
             yield context
         finally:
@@ -99,28 +253,27 @@ class BrowserManager:
         """Create a new page with stealth mode enabled.
 
         Args:
-            context: Optional existing context. If None, creates a new one.
+            context: Optional existing context. If None, uses the shared session context.
 
         Yields:
             Browser page with stealth features applied
         """
-        stealth = Stealth()
+        shared = context is None
+        if shared:
+            context = await self._get_shared_context()
+            self._shared_pages_opened += 1
+            self._open_pages[context] = self._open_pages.get(context, 0) + 1
 
-        if context:
+        try:
             page = await context.new_page()
-            await stealth.apply_stealth_async(page)
+            await STEALTH.apply_stealth_async(page)
             try:
                 yield page
             finally:
                 await page.close()
-        else:
-            async with self.new_context() as ctx:
-                page = await ctx.new_page()
-                await stealth.apply_stealth_async(page)
-                try:
-                    yield page
-                finally:
-                    await page.close()
+        finally:
+            if shared:
+                await self._release_shared_page(context)
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -1,9 +1,18 @@
 """Product page scraper."""
 
 import asyncio
+import html as html_lib
 import random
-from typing import Optional
-from bs4 import BeautifulSoup
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from urllib.parse import urljoin
+
+import httpx
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+from playwright.async_api import Page
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
@@ -12,33 +21,104 @@ from dpreview_scraper.models.camera import Camera, SearchResult
 from dpreview_scraper.parsers.product_parser import parse_product_page
 from dpreview_scraper.scraper.browser import BrowserManager
 from dpreview_scraper.scraper.stealth import (
-    CLOUDFLARE_CHALLENGE_INDICATOR,
     check_and_dismiss_cookie_popup,
+    is_cloudflare_challenge_html,
+    is_cloudflare_challenge_response,
     wait_for_cloudflare_challenge,
 )
 from dpreview_scraper.utils.rate_limiter import RateLimiter
 from dpreview_scraper.utils.logging import logger
 
 PAGE_LOAD_TIMEOUT_MS = 15000
+# Content waits use state="attached": only the serialized HTML is read, so there
+# is no need to also wait for layout/visibility
+OVERVIEW_READY_SELECTOR = "div.rightColumn.quickSpecs table"
+SPECS_READY_SELECTOR = "table.specsTable.compact"
+# Substrings that show server-rendered HTML already contains the content we parse
+OVERVIEW_READY_MARKER = "quickSpecs"
+SPECS_READY_MARKER = "specsTable"
+# Statuses Cloudflare answers with when it wants a browser challenge solved
+HTTP_CHALLENGE_STATUSES = frozenset({403, 429, 503})
 REVIEW_PAGE_EXTRA_DELAY = (3, 6)  # Random delay range (min, max) before review pages
+# Seconds a successful review fetch counts as Cloudflare clearance for the session
+CLOUDFLARE_CLEARANCE_TTL_SECONDS = 300
+# outerHTML of every review-specs content table, concatenated ("" if none)
+REVIEW_SPECS_TABLES_SCRIPT = (
+    "() => Array.from(document.querySelectorAll('table.contentTable'), t => t.outerHTML).join('')"
+)
+REVIEW_LINK_SELECTOR = sv.compile('a.actionButtonLink[href*="/reviews/"]')
+# Fast path: opening <a> tags carrying the actionButtonLink class, and a review href inside one
+ACTION_BUTTON_TAG_PATTERN = re.compile(
+    r'<a\s[^>]*?\bclass\s*=\s*["\'][^"\']*\bactionButtonLink\b[^>]*>', re.IGNORECASE
+)
+REVIEW_HREF_PATTERN = re.compile(
+    r'(?<![\w-])href\s*=\s*["\']([^"\']*/reviews/[^"\']*)["\']', re.IGNORECASE
+)
+
+
+def _is_action_button_class(class_value: str | None) -> bool:
+    """Check whether a raw class attribute marks an action button link."""
+    return class_value is not None and "actionButtonLink" in class_value.split()
+
+
+# The review link is the only thing read from the overview here, so only build action links
+ACTION_BUTTON_LINK_STRAINER = SoupStrainer("a", class_=_is_action_button_class)
 
 
 class ProductScraper:
     """Scraper for individual product pages."""
 
+    # Keep-alive pool for plain HTTP fetches of server-rendered pages
+    CONNECTION_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5)
+
+    # Default maximum browser tabs open at once. A product's overview/specs
+    # fallbacks and its review tab can be open together, so allow more tabs
+    # than products scraped concurrently
+    MAX_OPEN_PAGES = 3
+
     def __init__(
         self,
         browser_manager: BrowserManager,
         rate_limiter: RateLimiter,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_open_pages: int = MAX_OPEN_PAGES,
     ):
         """Initialize product scraper.
 
         Args:
             browser_manager: Browser manager instance
             rate_limiter: Rate limiter instance
+            http_client: Optional shared HTTP client for pages that don't need a
+                browser. If None, the scraper creates (and closes) its own.
+            max_open_pages: Maximum browser tabs open at once. When several
+                products are scraped concurrently, use more than the number of
+                concurrent products so their pages can load in parallel.
         """
         self.browser = browser_manager
         self.rate_limiter = rate_limiter
+        self._page_slots = asyncio.Semaphore(max_open_pages)
+        self._owns_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(
+            timeout=settings.request_timeout,
+            follow_redirects=True,
+            limits=self.CONNECTION_LIMITS,
+            headers={
+                "User-Agent": settings.user_agent,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.9",
+            },
+        )
+        # Set once plain HTTP gets challenged; Cloudflare won't let later
+        # requests through either, so go straight to the browser from then on
+        self._http_blocked = False
+        # When a review page last got past Cloudflare; the clearance cookie lives in
+        # the shared context, so concurrent products can skip the humanization
+        self._cf_cleared_at: Optional[float] = None
+
+    async def close(self) -> None:
+        """Close HTTP client if this scraper created it."""
+        if self._owns_client:
+            await self.http_client.aclose()
 
     def _extract_review_url(self, html: str, product_code: str) -> Optional[str]:
         """Extract review URL from product overview HTML.
@@ -50,218 +130,421 @@ class ProductScraper:
         Returns:
             Review URL or None if not found
         """
-        try:
-            soup = BeautifulSoup(html, "lxml")
-            review_link = soup.select_one('a.actionButtonLink[href*="/reviews/"]')
+        # No action buttons at all means no review link; skip parsing entirely
+        if "actionButtonLink" not in html:
+            logger.debug(f"No review link found in HTML for {product_code}")
+            return None
 
-            if review_link:
-                href = review_link.get("href")
-                if href:
-                    # Make URL absolute if needed
-                    if not href.startswith("http"):
-                        return f"{settings.base_url}{href}"
-                    return href
+        href = None
+        for tag_match in ACTION_BUTTON_TAG_PATTERN.finditer(html):
+            href_match = REVIEW_HREF_PATTERN.search(tag_match.group(0))
+            if href_match:
+                href = html_lib.unescape(href_match.group(1))
+                break
+
+        if not href:
+            # Unusual markup the regex can't read; fall back to parsing the links
+            try:
+                soup = BeautifulSoup(html, "lxml", parse_only=ACTION_BUTTON_LINK_STRAINER)
+                review_link = REVIEW_LINK_SELECTOR.select_one(soup)
+                if review_link:
+                    href = review_link.get("href")
+            except Exception as e:
+                logger.debug(f"Error extracting review URL for {product_code}: {e}")
+                return None
+
+        if href:
+            # Make URL absolute if needed (also handles protocol-relative hrefs)
+            return urljoin(settings.base_url, href)
+
+        logger.debug(f"No review link found in HTML for {product_code}")
+        return None
+
+    @asynccontextmanager
+    async def _open_page(self) -> AsyncIterator[Page]:
+        """Open a browser tab, waiting for a free slot if max_open_pages are in use."""
+        async with self._page_slots:
+            async with self.browser.new_page() as page:
+                yield page
 
-            logger.debug(f"No review link found in HTML for {product_code}")
+    async def _fetch_server_html(self, url: str, ready_marker: str) -> Optional[str]:
+        """Fetch a page over plain HTTP, without a browser.
+
+        Args:
+            url: Page URL
+            ready_marker: Substring the HTML must contain to be usable
+
+        Returns:
+            Page HTML, or None if the request failed or the content isn't there.
+            A Cloudflare challenge also marks plain HTTP as blocked for the session.
+        """
+        try:
+            response = await self.http_client.get(url)
+        except httpx.HTTPError as e:
+            logger.debug(f"HTTP fetch failed for {url}: {e}")
             return None
 
-        except Exception as e:
-            logger.debug(f"Error extracting review URL for {product_code}: {e}")
+        if (
+            response.status_code in HTTP_CHALLENGE_STATUSES
+            or response.headers.get("cf-mitigated") == "challenge"
+        ):
+            logger.info(
+                f"Plain HTTP challenged for {url} (status {response.status_code}); "
+                "using the browser for the rest of the session"
+            )
+            self._http_blocked = True
             return None
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((PlaywrightTimeoutError, ConnectionError)),
-    )
-    async def scrape_product(self, search_result: SearchResult) -> Optional[Camera]:
-        """Scrape a single product page.
+        if response.status_code != 200 or ready_marker not in response.text:
+            logger.debug(f"HTTP fetch unusable for {url} (status {response.status_code})")
+            return None
+
+        return response.text
+
+    async def _fetch_page_html(
+        self,
+        url: str,
+        ready_selector: str,
+        ready_marker: str,
+        description: str,
+        product_code: str,
+    ) -> str:
+        """Return a page's HTML, using the browser only when plain HTTP isn't enough.
 
         Args:
-            search_result: Search result with product info
+            url: Page URL
+            ready_selector: Selector that marks the page content as loaded
+            ready_marker: Substring that marks server-rendered HTML as complete
+            description: What the selector waits for, for the timeout warning
+            product_code: Product code for logging
 
         Returns:
-            Camera object with full data, or None if scraping failed
+            Page HTML (possibly incomplete if the selector wait timed out)
         """
         await self.rate_limiter.acquire()
 
-        url = search_result.url
-        if not url.startswith("http"):
-            url = f"{settings.base_url}{url}"
+        # Overview and specs pages are server-rendered; skip the browser when we can
+        if not self._http_blocked:
+            html = await self._fetch_server_html(url, ready_marker)
+            if html is not None:
+                return html
+            # The HTTP request used up this token; the browser navigation is
+            # another request to the site, so it needs its own
+            await self.rate_limiter.acquire()
+
+        logger.debug(f"Falling back to browser for {description}: {product_code}")
+        async with self._open_page() as page:
+            # The selector wait is the readiness signal, so don't block on
+            # trailing analytics requests
+            await page.goto(url, wait_until="domcontentloaded", timeout=settings.browser_timeout)
+
+            try:
+                await page.wait_for_selector(
+                    ready_selector, state="attached", timeout=PAGE_LOAD_TIMEOUT_MS
+                )
+            except PlaywrightTimeoutError:
+                logger.warning(f"Timeout waiting for {description}: {product_code}")
+
+            return await page.content()
 
-        logger.info(f"Scraping product: {search_result.name} ({search_result.product_code})")
+    def _has_fresh_clearance(self) -> bool:
+        """Check whether a review page got past Cloudflare recently in this session."""
+        return (
+            self._cf_cleared_at is not None
+            and time.monotonic() - self._cf_cleared_at < CLOUDFLARE_CLEARANCE_TTL_SECONDS
+        )
+
+    async def _fetch_review_specs(self, review_specs_url: str, product_code: str) -> Optional[str]:
+        """Fetch the review specs page (page 2 of the review) in its own tab.
+
+        Args:
+            review_specs_url: Review specs page URL
+            product_code: Product code for logging
+
+        Returns:
+            Concatenated review-specs tables HTML, or None if unavailable
+        """
+        logger.debug(f"Fetching review specs from: {review_specs_url}")
 
         try:
-            async with self.browser.new_page() as page:
-                # Navigate to product overview page
-                await page.goto(url, wait_until="networkidle", timeout=settings.browser_timeout)
+            # Extra delay before review specs page
+            extra_delay = random.uniform(*REVIEW_PAGE_EXTRA_DELAY)
+            logger.debug(f"Adding extra delay of {extra_delay:.1f}s before review specs page")
+            await asyncio.sleep(extra_delay)
+
+            await self.rate_limiter.acquire()
+            async with self._open_page() as page:
+                await page.goto(review_specs_url, wait_until="domcontentloaded", timeout=60000)
 
-                # Wait for main content - quick specs table on overview page
+                # Check for cookie popup on specs page too
+                await check_and_dismiss_cookie_popup(page)
+
+                # Wait for specs content
                 try:
                     await page.wait_for_selector(
-                        "div.rightColumn.quickSpecs table",
-                        timeout=PAGE_LOAD_TIMEOUT_MS,
+                        "table.contentTable", state="attached", timeout=PAGE_LOAD_TIMEOUT_MS
                     )
+                    logger.debug(f"Review specs table found for {product_code}")
                 except PlaywrightTimeoutError:
-                    logger.warning(f"Timeout waiting for overview content: {search_result.product_code}")
+                    logger.debug(f"Timeout waiting for review specs table: {product_code}")
+
+                # Only the content tables are parsed from this page, so
+                # serialize just those instead of the whole document
+                return await page.evaluate(REVIEW_SPECS_TABLES_SCRIPT) or None
+
+        except Exception as e:
+            logger.debug(f"No review specs page available for {product_code}: {e}")
+            return None
+
+    async def _read_review_article(self, page: Page, product_code: str) -> str:
+        """Wait for the review article on an already-loaded page and return its HTML.
+
+        Args:
+            page: Page showing the review
+            product_code: Product code for logging
+
+        Returns:
+            Review page HTML
+        """
+        try:
+            await page.wait_for_selector(
+                "div.article", state="attached", timeout=PAGE_LOAD_TIMEOUT_MS
+            )
+            logger.debug(f"Review article content found for {product_code}")
+        except PlaywrightTimeoutError:
+            logger.debug(f"Timeout waiting for review article: {product_code}")
+
+        return await page.content()
+
+    async def _fetch_review_pages(
+        self, review_url: str, product_code: str
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Fetch the review page and its specs page, handling Cloudflare.
+
+        The specs page is only requested once the review page is verified to be
+        past Cloudflare.
 
-                # Get overview page content
-                overview_html = await page.content()
+        Args:
+            review_url: Review page URL
+            product_code: Product code for logging
 
-                # Navigate to specifications page for full specs
-                specs_url = f"{url}/specifications"
-                logger.debug(f"Fetching specifications from: {specs_url}")
+        Returns:
+            Tuple of (review_html, review_specs_html); either may be None
+        """
+        review_specs_url = f"{review_url}/2"
+
+        logger.debug(f"Fetching review from: {review_url}")
+        logger.debug(f"[CLOUDFLARE] Attempting to fetch review page for {product_code}")
+
+        async with self._open_page() as page:
+            try:
+                # Extra delay before review pages (reviews are more heavily protected)
+                extra_delay = random.uniform(*REVIEW_PAGE_EXTRA_DELAY)
+                logger.debug(f"Adding extra delay of {extra_delay:.1f}s before review page")
+                await asyncio.sleep(extra_delay)
 
                 await self.rate_limiter.acquire()
-                await page.goto(specs_url, wait_until="networkidle", timeout=settings.browser_timeout)
 
-                # Wait for specs table
-                try:
-                    await page.wait_for_selector(
-                        "table.specsTable.compact",
-                        timeout=PAGE_LOAD_TIMEOUT_MS,
+                # Use domcontentloaded instead of networkidle for faster initial load
+                response = await page.goto(review_url, wait_until="domcontentloaded", timeout=60000)
+
+                # Check for and dismiss cookie popup first
+                await check_and_dismiss_cookie_popup(page)
+
+                # Wait for Cloudflare challenge to resolve; a clean response needs no wait
+                if is_cloudflare_challenge_response(response):
+                    logger.debug(f"[CLOUDFLARE] Checking for Cloudflare challenge on review page")
+                    challenge_resolved = await wait_for_cloudflare_challenge(
+                        page, humanize=not self._has_fresh_clearance()
                     )
-                except PlaywrightTimeoutError:
-                    logger.warning(f"Timeout waiting for specs table: {search_result.product_code}")
-
-                # Get specifications page content
-                specs_html = await page.content()
-
-                # Extract review URL from overview HTML (already fetched)
-                review_html = None
-                review_specs_html = None
-                review_url = self._extract_review_url(overview_html, search_result.product_code)
-
-                if review_url:
-                    logger.debug(f"Fetching review from: {review_url}")
-                    logger.debug(f"[CLOUDFLARE] Attempting to fetch review page for {search_result.product_code}")
-
-                    try:
-                        # Extra delay before review pages (reviews are more heavily protected)
-                        extra_delay = random.uniform(*REVIEW_PAGE_EXTRA_DELAY)
-                        logger.debug(f"Adding extra delay of {extra_delay:.1f}s before review page")
-                        await asyncio.sleep(extra_delay)
-
-                        await self.rate_limiter.acquire()
-
-                        # Use domcontentloaded instead of networkidle for faster initial load
-                        await page.goto(review_url, wait_until="domcontentloaded", timeout=60000)
-
-                        # Check for and dismiss cookie popup first
-                        await check_and_dismiss_cookie_popup(page)
-
-                        # Wait for Cloudflare challenge to resolve
-                        logger.debug(f"[CLOUDFLARE] Checking for Cloudflare challenge on review page")
-                        challenge_resolved = await wait_for_cloudflare_challenge(page)
-
-                        if not challenge_resolved:
-                            logger.warning(
-                                f"[CLOUDFLARE] Challenge NOT resolved for {search_result.product_code} - "
-                                f"USING FALLBACK MODE (basic specs only)"
-                            )
-                            logger.debug(
-                                f"[FALLBACK] Skipping review content for {search_result.product_code}. "
-                                f"Detailed video modes and review data will not be available."
-                            )
-                            # Skip review content and continue with basic specs
-                            review_html = None
-                            review_specs_html = None
-                        else:
-                            # Challenge resolved, proceed with fetching review content
-                            logger.debug(f"[CLOUDFLARE] Challenge resolved successfully for {search_result.product_code}")
-                            # Wait for review content
-                            try:
-                                await page.wait_for_selector("div.article", timeout=PAGE_LOAD_TIMEOUT_MS)
-                                logger.debug(f"Review article content found for {search_result.product_code}")
-                            except PlaywrightTimeoutError:
-                                logger.debug(f"Timeout waiting for review article: {search_result.product_code}")
-
-                            review_html = await page.content()
-
-                            # Verify we actually got review content and not Cloudflare page
-                            if CLOUDFLARE_CHALLENGE_INDICATOR in (await page.title()).lower():
-                                logger.warning(
-                                    f"[CLOUDFLARE] Still blocked on Cloudflare page for {search_result.product_code} - "
-                                    f"USING FALLBACK MODE"
-                                )
-                                logger.debug(f"[FALLBACK] Review content unavailable, using basic specs only")
-                                review_html = None
-                            else:
-                                logger.debug(f"[SUCCESS] Review page fetched successfully for {search_result.product_code}")
-
-                                # Fetch review page 2 (specs page) - more comprehensive specs
-                                review_specs_url = f"{review_url}/2"
-                                logger.debug(f"Fetching review specs from: {review_specs_url}")
-
-                                try:
-                                    # Extra delay before review specs page
-                                    extra_delay = random.uniform(*REVIEW_PAGE_EXTRA_DELAY)
-                                    logger.debug(f"Adding extra delay of {extra_delay:.1f}s before review specs page")
-                                    await asyncio.sleep(extra_delay)
-
-                                    await self.rate_limiter.acquire()
-                                    await page.goto(review_specs_url, wait_until="domcontentloaded", timeout=60000)
-
-                                    # Check for cookie popup on specs page too
-                                    await check_and_dismiss_cookie_popup(page)
-
-                                    # Wait for specs content
-                                    try:
-                                        await page.wait_for_selector("table.contentTable", timeout=PAGE_LOAD_TIMEOUT_MS)
-                                        logger.debug(f"Review specs table found for {search_result.product_code}")
-                                    except PlaywrightTimeoutError:
-                                        logger.debug(f"Timeout waiting for review specs table: {search_result.product_code}")
-
-                                    review_specs_html = await page.content()
-
-                                except Exception as e:
-                                    logger.debug(f"No review specs page available for {search_result.product_code}: {e}")
-
-                    except Exception as e:
-                        logger.debug(f"No review page available for {search_result.product_code}: {e}")
                 else:
-                    logger.debug(f"No review link found for {search_result.product_code}")
-
-                # Log data sources being used
-                data_sources = []
-                if overview_html:
-                    data_sources.append("overview")
-                if specs_html:
-                    data_sources.append("specs")
-                if review_html:
-                    data_sources.append("review")
-                if review_specs_html:
-                    data_sources.append("review_specs")
-
-                logger.debug(f"[DATA SOURCES] Parsing {search_result.product_code} using: {', '.join(data_sources)}")
-                if not review_html and not review_specs_html:
-                    logger.debug(f"[FALLBACK] Operating in fallback mode - no review data available")
-
-                # Parse product data from all pages
-                camera = parse_product_page(
-                    overview_html,
-                    specs_html,
-                    review_html,
-                    review_specs_html,
-                    product_code=search_result.product_code,
-                    url=search_result.url,
-                    short_specs=search_result.short_specs,
-                )
+                    logger.debug(f"[CLOUDFLARE] No challenge (status {response.status})")
+                    challenge_resolved = True
+
+                if not challenge_resolved:
+                    logger.warning(
+                        f"[CLOUDFLARE] Challenge NOT resolved for {product_code} - "
+                        f"USING FALLBACK MODE (basic specs only)"
+                    )
+                    logger.debug(
+                        f"[FALLBACK] Skipping review content for {product_code}. "
+                        f"Detailed video modes and review data will not be available."
+                    )
+                    # Skip review content and continue with basic specs
+                    return None, None
+
+                logger.debug(f"[CLOUDFLARE] Challenge resolved successfully for {product_code}")
+
+                review_html = await self._read_review_article(page, product_code)
+
+                # Verify we actually got review content and not Cloudflare page
+                # before requesting page 2 from a site that may still be challenging us
+                if is_cloudflare_challenge_html(review_html):
+                    logger.warning(
+                        f"[CLOUDFLARE] Still blocked on Cloudflare page for {product_code} - "
+                        f"USING FALLBACK MODE"
+                    )
+                    logger.debug(f"[FALLBACK] Review content unavailable, using basic specs only")
+                    return None, None
 
-                # Fill in data from search result if missing
-                if not camera.Name:
-                    camera.Name = search_result.name
-                if not camera.ImageURL:
-                    camera.ImageURL = search_result.image_url
-                if search_result.announced and not camera.Specs.Announced:
-                    camera.Specs.Announced = search_result.announced
+                logger.debug(f"[SUCCESS] Review page fetched successfully for {product_code}")
+                self._cf_cleared_at = time.monotonic()
 
-                # Store review URL for archive lookup
-                if review_url:
-                    camera.review_url = review_url
+                # Persist the clearance cookie; the shared context already
+                # reuses it for later products in this run
+                await self.browser.save_storage_state()
+
+            except Exception as e:
+                logger.debug(f"No review page available for {product_code}: {e}")
+                return None, None
+
+        # The clearance cookie lives in the shared context, so the specs page
+        # (review page 2) loads in a fresh tab once the review tab is closed
+        review_specs_html = await self._fetch_review_specs(review_specs_url, product_code)
+
+        return review_html, review_specs_html
+
+    async def _fetch_overview_and_review(
+        self, url: str, product_code: str, review_url: Optional[str] = None
+    ) -> tuple[str, Optional[str], Optional[str], Optional[str]]:
+        """Fetch the overview page and the review pages it links to (if any).
+
+        Args:
+            url: Product overview URL
+            product_code: Product code for logging
+            review_url: Review URL already known from the search listing. When
+                given, the review pages load alongside the overview instead of
+                waiting for its review link.
 
-                logger.info(f"Successfully scraped: {search_result.product_code}")
-                return camera
+        Returns:
+            Tuple of (overview_html, review_url, review_html, review_specs_html)
+        """
+        if review_url:
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    overview_task = task_group.create_task(
+                        self._fetch_page_html(
+                            url,
+                            OVERVIEW_READY_SELECTOR,
+                            OVERVIEW_READY_MARKER,
+                            "overview content",
+                            product_code,
+                        )
+                    )
+                    review_task = task_group.create_task(
+                        self._fetch_review_pages(review_url, product_code)
+                    )
+            except ExceptionGroup as eg:
+                raise eg.exceptions[0]
+
+            review_html, review_specs_html = review_task.result()
+            return overview_task.result(), review_url, review_html, review_specs_html
+
+        overview_html = await self._fetch_page_html(
+            url,
+            OVERVIEW_READY_SELECTOR,
+            OVERVIEW_READY_MARKER,
+            "overview content",
+            product_code,
+        )
+
+        review_url = self._extract_review_url(overview_html, product_code)
+        if not review_url:
+            logger.debug(f"No review link found for {product_code}")
+            return overview_html, None, None, None
+
+        review_html, review_specs_html = await self._fetch_review_pages(review_url, product_code)
+        return overview_html, review_url, review_html, review_specs_html
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type((PlaywrightTimeoutError, ConnectionError)),
+    )
+    async def scrape_product(self, search_result: SearchResult) -> Optional[Camera]:
+        """Scrape a single product page.
+
+        Args:
+            search_result: Search result with product info
+
+        Returns:
+            Camera object with full data, or None if scraping failed
+        """
+        url = urljoin(settings.base_url, search_result.url)
+        specs_url = f"{url}/specifications"
+
+        logger.info(f"Scraping product: {search_result.name} ({search_result.product_code})")
+
+        try:
+            # The review chain only depends on the overview, so it starts as soon as
+            # the overview is in, while the specs page is still loading alongside.
+            # A TaskGroup cancels the sibling (and its Cloudflare wait) if either fails.
+            logger.debug(f"Fetching specifications from: {specs_url}")
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    overview_task = task_group.create_task(
+                        self._fetch_overview_and_review(
+                            url, search_result.product_code, search_result.review_url
+                        )
+                    )
+                    specs_task = task_group.create_task(
+                        self._fetch_page_html(
+                            specs_url,
+                            SPECS_READY_SELECTOR,
+                            SPECS_READY_MARKER,
+                            "specs table",
+                            search_result.product_code,
+                        )
+                    )
+            except ExceptionGroup as eg:
+                # Surface the original failure so retries and the handlers below see it
+                raise eg.exceptions[0]
+
+            overview_html, review_url, review_html, review_specs_html = overview_task.result()
+            specs_html = specs_task.result()
+
+            # Log data sources being used
+            data_sources = []
+            if overview_html:
+                data_sources.append("overview")
+            if specs_html:
+                data_sources.append("specs")
+            if review_html:
+                data_sources.append("review")
+            if review_specs_html:
+                data_sources.append("review_specs")
+
+            logger.debug(f"[DATA SOURCES] Parsing {search_result.product_code} using: {', '.join(data_sources)}")
+            if not review_html and not review_specs_html:
+                logger.debug(f"[FALLBACK] Operating in fallback mode - no review data available")
+
+            # Parse product data from all pages; soup construction and extraction
+            # are CPU-bound, so run them in a worker thread to keep the event loop free
+            camera = await asyncio.to_thread(
+                parse_product_page,
+                overview_html,
+                specs_html,
+                review_html,
+                review_specs_html,
+                product_code=search_result.product_code,
+                url=search_result.url,
+                short_specs=search_result.short_specs,
+            )
+
+            # Fill in data from search result if missing
+            if not camera.Name:
+                camera.Name = search_result.name
+            if not camera.ImageURL:
+                camera.ImageURL = search_result.image_url
+            if search_result.announced and not camera.Specs.Announced:
+                camera.Specs.Announced = search_result.announced
+
+            # Store review URL for archive lookup
+            if review_url:
+                camera.review_url = review_url
+
+            logger.info(f"Successfully scraped: {search_result.product_code}")
+            return camera
 
         except PlaywrightTimeoutError as e:
             logger.error(f"Timeout scraping {search_result.product_code}: {e}")
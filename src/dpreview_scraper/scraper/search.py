@@ -1,6 +1,7 @@
 """Search page scraper."""
 
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 
@@ -11,6 +12,38 @@ from dpreview_scraper.scraper.browser import BrowserManager
 from dpreview_scraper.utils.rate_limiter import RateLimiter
 from dpreview_scraper.utils.logging import logger
 
+# strptime formats tried, in order, for announcement dates that aren't ISO; the
+# numeric ones catch dates without zero padding (e.g. "2023-3-7"), which
+# fromisoformat rejects
+ANNOUNCED_DATE_FORMATS = ("%b %d, %Y", "%B %d, %Y", "%b %Y", "%Y-%m-%d", "%Y-%m")
+
+
+@lru_cache(maxsize=1024)
+def _parse_announced(text: str) -> Optional[datetime]:
+    """Parse an announcement date from a search listing.
+
+    Cached because listing rows repeat a handful of strings, and an unparseable
+    one (e.g. "Announced 2 months ago") would otherwise fail every format again.
+
+    Args:
+        text: Announcement date text
+
+    Returns:
+        Parsed datetime, or None if no known format matches
+    """
+    try:
+        # ISO dates; a bare year-month counts as the first of the month
+        return datetime.fromisoformat(f"{text}-01" if len(text) == 7 else text)
+    except ValueError:
+        pass
+
+    for fmt in ANNOUNCED_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
 
 class SearchScraper:
     """Scraper for DPReview camera search page."""
@@ -113,14 +146,18 @@ class SearchScraper:
 
         async with self.browser.new_page() as page:
             try:
-                # Navigate to search page
-                await page.goto(url, wait_until="networkidle", timeout=settings.browser_timeout)
+                # Navigate to search page; the product list wait below is the
+                # readiness signal, so don't block on trailing analytics requests
+                await page.goto(
+                    url, wait_until="domcontentloaded", timeout=settings.browser_timeout
+                )
 
                 # Wait for product list to load
                 # The search page uses a table structure with class "productList"
                 try:
                     await page.wait_for_selector(
                         "table.productList tr.product",
+                        state="attached",
                         timeout=10000,
                     )
                 except PlaywrightTimeoutError:
@@ -163,16 +200,7 @@ class SearchScraper:
                 continue
 
             try:
-                # Try to parse various date formats
-                announced_date = None
-
-                # Try ISO format first
-                for fmt in ["%Y-%m-%d", "%b %d, %Y", "%B %d, %Y", "%Y-%m", "%b %Y"]:
-                    try:
-                        announced_date = datetime.strptime(result.announced, fmt)
-                        break
-                    except ValueError:
-                        continue
+                announced_date = _parse_announced(result.announced)
 
                 if announced_date and announced_date >= self.after_datetime:
                     filtered.append(result)
@@ -1,15 +1,110 @@
 """Anti-detection and Cloudflare challenge handling."""
 
 import asyncio
+import json
 import random
+import re
+from typing import Optional
 
-from playwright.async_api import Page
+from playwright.async_api import Page, Response
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from dpreview_scraper.utils.logging import logger
 
 # Cloudflare bypass configuration
 CLOUDFLARE_CHALLENGE_INDICATOR = "just a moment"
 CLOUDFLARE_MAX_WAIT_SECONDS = 60
+COOKIE_CLICK_TIMEOUT_MS = 5000
+# Case-insensitive match for the indicator, so titles don't need lowercasing per check
+CLOUDFLARE_CHALLENGE_PATTERN = re.compile(re.escape(CLOUDFLARE_CHALLENGE_INDICATOR), re.IGNORECASE)
+# First <title> element of a serialized page
+HTML_TITLE_PATTERN = re.compile(r"<title[^>]*>([^<]*)</title>", re.IGNORECASE)
+# Title and cookie-banner presence, read in a single round trip
+PAGE_STATE_SCRIPT = """() => [
+    document.title,
+    document.querySelector('[id*="cookie"], [class*="cookie"], [class*="consent"]') !== null,
+]"""
+# Cookie accept buttons in priority order, as (CSS selector, lowercase text the
+# button must contain or None)
+COOKIE_BUTTON_CANDIDATES = [
+    ('button[id*="accept"]', None),
+    ('button[class*="accept"]', None),
+    ("button", "accept"),
+    ("button", "i accept"),
+    ("button", "got it"),
+    ('[id*="cookie"] button', None),
+    ('[class*="consent"] button', None),
+]
+# Equivalent Playwright selectors (has-text is case-insensitive), used for the click
+COOKIE_BUTTON_SELECTORS = [
+    f'{css}:has-text("{text}")' if text else css for css, text in COOKIE_BUTTON_CANDIDATES
+]
+# Finds every candidate present on the page in one evaluate; returns their indices
+# in priority order so a failed click can fall through to the next one
+FIND_COOKIE_BUTTONS_SCRIPT = """() => {
+    const candidates = %s;
+    const found = [];
+    for (let i = 0; i < candidates.length; i++) {
+        const [css, text] = candidates[i];
+        for (const el of document.querySelectorAll(css)) {
+            if (text === null || el.textContent.toLowerCase().includes(text)) {
+                found.push(i);
+                break;
+            }
+        }
+    }
+    return found;
+}""" % json.dumps(COOKIE_BUTTON_CANDIDATES)
+# Scroll offsets (px) for the reading simulation, then back to the top
+SCROLL_SIMULATION_STEPS = [100, 250, 400, 300, 150]
+# Smooth-scrolls through the steps with 0.3-0.8s pauses, then returns to the top
+# with a 0.5-1.0s pause, all inside the page
+SCROLL_SIMULATION_SCRIPT = """async (steps) => {
+    const pause = (min, max) => new Promise(r => setTimeout(r, min + Math.random() * (max - min)));
+    for (const top of steps) {
+        window.scrollTo({ top, behavior: 'smooth' });
+        await pause(300, 800);
+    }
+    window.scrollTo({ top: 0, behavior: 'smooth' });
+    await pause(500, 1000);
+}"""
+# Evaluated in the page until the challenge title is gone (survives the post-challenge reload)
+CLOUDFLARE_RESOLVED_SCRIPT = (
+    f"() => !document.title.toLowerCase().includes('{CLOUDFLARE_CHALLENGE_INDICATOR}')"
+)
+
+
+def is_cloudflare_challenge_response(response: Optional[Response]) -> bool:
+    """Check whether a navigation response looks like a Cloudflare challenge.
+
+    Every dpreview response is served by Cloudflare, so the server header says
+    nothing; challenges are marked by an error status or the cf-mitigated header.
+
+    Args:
+        response: Response returned by page.goto (None for same-document navigations)
+
+    Returns:
+        True if the response may be a challenge and the title wait is needed
+    """
+    if response is None:
+        return True
+    return response.status >= 400 or response.headers.get("cf-mitigated") == "challenge"
+
+
+def is_cloudflare_challenge_html(html: str) -> bool:
+    """Check whether already-fetched page HTML is a Cloudflare challenge page.
+
+    Args:
+        html: Serialized page HTML
+
+    Returns:
+        True if the page title carries the challenge indicator
+    """
+    title_match = HTML_TITLE_PATTERN.search(html)
+    return (
+        title_match is not None
+        and CLOUDFLARE_CHALLENGE_PATTERN.search(title_match.group(1)) is not None
+    )
 
 
 async def check_and_dismiss_cookie_popup(page: Page) -> bool:
@@ -22,25 +117,15 @@ async def check_and_dismiss_cookie_popup(page: Page) -> bool:
         True if popup was found and dismissed, False otherwise
     """
     try:
-        cookie_selectors = [
-            'button[id*="accept"]',
-            'button[class*="accept"]',
-            'button:has-text("Accept")',
-            'button:has-text("I Accept")',
-            'button:has-text("Got it")',
-            '[id*="cookie"] button',
-            '[class*="consent"] button',
-        ]
-
-        for selector in cookie_selectors:
+        # One round trip finds the matching candidates instead of querying each selector
+        for index in await page.evaluate(FIND_COOKIE_BUTTONS_SCRIPT):
+            selector = COOKIE_BUTTON_SELECTORS[index]
             try:
-                button = await page.query_selector(selector)
-                if button:
-                    logger.debug(f"[COOKIE] Found cookie popup button with selector: {selector}")
-                    await button.click()
-                    logger.debug("[COOKIE] Clicked cookie accept button")
-                    await asyncio.sleep(1)
-                    return True
+                logger.debug(f"[COOKIE] Found cookie popup button with selector: {selector}")
+                await page.locator(selector).first.click(timeout=COOKIE_CLICK_TIMEOUT_MS)
+                logger.debug("[COOKIE] Clicked cookie accept button")
+                await asyncio.sleep(1)
+                return True
             except Exception as e:
                 logger.debug(f"[COOKIE] Could not click selector {selector}: {e}")
 
@@ -52,8 +137,34 @@ async def check_and_dismiss_cookie_popup(page: Page) -> bool:
         return False
 
 
+async def _simulate_reading(page: Page) -> None:
+    """Move the mouse and scroll like a reader, to help pass a Cloudflare challenge."""
+    # Random initial delay
+    await asyncio.sleep(random.uniform(2, 4))
+
+    # Simulate mouse movement
+    try:
+        viewport_size = page.viewport_size
+        if viewport_size:
+            for _ in range(3):
+                x = random.randint(100, viewport_size["width"] - 100)
+                y = random.randint(100, viewport_size["height"] - 100)
+                await page.mouse.move(x, y)
+                await asyncio.sleep(random.uniform(0.1, 0.3))
+    except Exception as e:
+        logger.debug(f"Mouse movement simulation failed: {e}")
+
+    # Scroll down slowly to simulate reading; the whole sequence runs in one evaluate
+    try:
+        await page.evaluate(SCROLL_SIMULATION_SCRIPT, SCROLL_SIMULATION_STEPS)
+    except Exception as e:
+        logger.debug(f"Scroll simulation failed: {e}")
+
+
 async def wait_for_cloudflare_challenge(
-    page: Page, max_wait_seconds: int = CLOUDFLARE_MAX_WAIT_SECONDS
+    page: Page,
+    max_wait_seconds: int = CLOUDFLARE_MAX_WAIT_SECONDS,
+    humanize: bool = True,
 ) -> bool:
     """Wait for Cloudflare challenge to complete with human-like behavior.
 
@@ -63,72 +174,53 @@ async def wait_for_cloudflare_challenge(
     Args:
         page: Playwright page
         max_wait_seconds: Maximum time to wait for challenge
+        humanize: Whether to simulate mouse movement and scrolling first. Can be
+            skipped when the context recently earned clearance and the
+            challenge is expected to pass on its own.
 
     Returns:
         True if challenge resolved, False if still blocked
     """
     try:
-        title = await page.title()
+        title, has_cookie_popup = await page.evaluate(PAGE_STATE_SCRIPT)
         logger.debug(f"[CLOUDFLARE] Current page title: '{title}'")
 
-        if CLOUDFLARE_CHALLENGE_INDICATOR not in title.lower():
+        if CLOUDFLARE_CHALLENGE_PATTERN.search(title) is None:
             logger.debug("[CLOUDFLARE] No challenge detected - page loaded successfully")
-            try:
-                cookie_popup = await page.query_selector(
-                    '[id*="cookie"], [class*="cookie"], [class*="consent"]'
-                )
-                if cookie_popup:
-                    logger.debug("[COOKIE] Cookie consent popup detected on page")
-            except Exception as e:
-                logger.debug(f"[COOKIE] Error checking for cookie popup: {e}")
+            if has_cookie_popup:
+                logger.debug("[COOKIE] Cookie consent popup detected on page")
             return True
 
         logger.warning(
             f"[CLOUDFLARE] Challenge detected! Waiting up to {max_wait_seconds}s for resolution..."
         )
 
-        # Random initial delay
-        await asyncio.sleep(random.uniform(2, 4))
-
-        # Simulate mouse movement
+        # Humanize while waiting rather than before it, so a challenge that clears
+        # quickly isn't held up by the simulation's pauses
+        simulation = None
+        if humanize:
+            simulation = asyncio.create_task(_simulate_reading(page))
+        else:
+            logger.debug("[CLOUDFLARE] Recent clearance in this session; skipping humanization")
+
+        # Wait for title to change (challenge completed); the check runs inside the
+        # page, so there is no per-second title round trip from Python
+        loop_time = asyncio.get_running_loop().time
+        start_time = loop_time()
         try:
-            viewport_size = page.viewport_size
-            if viewport_size:
-                for _ in range(3):
-                    x = random.randint(100, viewport_size["width"] - 100)
-                    y = random.randint(100, viewport_size["height"] - 100)
-                    await page.mouse.move(x, y)
-                    await asyncio.sleep(random.uniform(0.1, 0.3))
-        except Exception as e:
-            logger.debug(f"Mouse movement simulation failed: {e}")
-
-        # Scroll down slowly to simulate reading
-        try:
-            scroll_steps = [100, 250, 400, 300, 150]
-            for scroll_y in scroll_steps:
-                await page.evaluate(
-                    f"window.scrollTo({{ top: {scroll_y}, behavior: 'smooth' }})"
-                )
-                await asyncio.sleep(random.uniform(0.3, 0.8))
-
-            await page.evaluate("window.scrollTo({ top: 0, behavior: 'smooth' })")
-            await asyncio.sleep(random.uniform(0.5, 1.0))
-        except Exception as e:
-            logger.debug(f"Scroll simulation failed: {e}")
-
-        # Wait for title to change (challenge completed)
-        start_time = asyncio.get_event_loop().time()
-        check_interval = 1
-
-        while (asyncio.get_event_loop().time() - start_time) < max_wait_seconds:
-            await asyncio.sleep(check_interval)
-
-            current_title = await page.title()
-            if CLOUDFLARE_CHALLENGE_INDICATOR not in current_title.lower():
-                elapsed = asyncio.get_event_loop().time() - start_time
-                logger.info(f"[CLOUDFLARE] Challenge resolved successfully after {elapsed:.1f}s!")
-                await asyncio.sleep(random.uniform(1.5, 3.0))
-                return True
+            await page.wait_for_function(
+                CLOUDFLARE_RESOLVED_SCRIPT, timeout=max_wait_seconds * 1000
+            )
+        except PlaywrightTimeoutError:
+            pass
+        else:
+            elapsed = loop_time() - start_time
+            logger.info(f"[CLOUDFLARE] Challenge resolved successfully after {elapsed:.1f}s!")
+            await asyncio.sleep(random.uniform(1.5, 3.0))
+            return True
+        finally:
+            if simulation is not None:
+                simulation.cancel()
 
         logger.warning(f"[CLOUDFLARE] Challenge FAILED - timeout after {max_wait_seconds}s")
         logger.debug("[CLOUDFLARE] Will fall back to basic specs without review data")
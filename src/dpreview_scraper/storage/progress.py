@@ -11,13 +11,20 @@ from dpreview_scraper.utils.logging import logger
 class ProgressTracker:
     """Track scraping progress for resumability."""
 
-    def __init__(self, progress_file: Path):
+    # Default number of marked products between progress file writes
+    FLUSH_EVERY = 25
+
+    def __init__(self, progress_file: Path, flush_every: int = FLUSH_EVERY):
         """Initialize progress tracker.
 
         Args:
             progress_file: Path to progress JSON file
+            flush_every: Write the file after this many mark_completed/mark_failed
+                calls; call flush() to write pending changes sooner
         """
         self.progress_file = Path(progress_file)
+        self.flush_every = max(1, flush_every)
+        self._pending = 0  # Marks not yet written to the progress file
         self.completed: Set[str] = set()
         self.failed: Set[str] = set()
         self.total: int = 0
@@ -54,19 +61,36 @@ class ProgressTracker:
         self.last_updated = datetime.now().isoformat()
 
         data = {
-            "completed": sorted(list(self.completed)),
-            "failed": sorted(list(self.failed)),
+            "completed": sorted(self.completed),
+            "failed": sorted(self.failed),
             "total": self.total,
             "started_at": self.started_at,
             "last_updated": self.last_updated,
         }
 
         try:
-            with open(self.progress_file, "w") as f:
-                json.dump(data, f, indent=2)
+            # Indented because people read and diff this file; the text is built
+            # in memory so the file gets a single write instead of one per chunk
+            self.progress_file.write_text(json.dumps(data, indent=2))
+            self._pending = 0
         except Exception as e:
             logger.error(f"Failed to save progress file: {e}")
 
+    def flush(self) -> None:
+        """Save progress if any marks haven't been written yet."""
+        if self._pending:
+            self.save()
+
+    def _record_change(self) -> None:
+        """Count a mark and save once enough have accumulated.
+
+        Each save rewrites the whole file, so saving per product would make a
+        long run quadratic in bytes written.
+        """
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.save()
+
     def start(self, total: int) -> None:
         """Mark scraping as started.
 
@@ -87,7 +111,7 @@ class ProgressTracker:
         self.completed.add(product_code)
         # Remove from failed if it was there
         self.failed.discard(product_code)
-        self.save()
+        self._record_change()
 
     def mark_failed(self, product_code: str) -> None:
         """Mark product as failed.
@@ -96,7 +120,7 @@ class ProgressTracker:
             product_code: Product code
         """
         self.failed.add(product_code)
-        self.save()
+        self._record_change()
 
     def is_completed(self, product_code: str) -> bool:
         """Check if product was already scraped.
@@ -118,7 +142,8 @@ class ProgressTracker:
         Returns:
             List of product codes to scrape
         """
-        return [p for p in all_products if p not in self.completed]
+        completed = self.completed
+        return [p for p in all_products if p not in completed]
 
     def get_stats(self) -> Dict[str, any]:
         """Get progress statistics.
@@ -146,6 +171,7 @@ class ProgressTracker:
         self.total = 0
         self.started_at = ""
         self.last_updated = ""
+        self._pending = 0
 
         if self.progress_file.exists():
             self.progress_file.unlink()
@@ -1,7 +1,9 @@
 """YAML output writer."""
 
+import os
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Set
 import yaml
 
 from dpreview_scraper.models.camera import Camera
@@ -18,7 +20,10 @@ class YAMLWriter:
             output_dir: Directory to write YAML files
         """
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Created on the first write, so a writer that never writes touches nothing
+        self._dir_created = False
+        # Product codes with a YAML file, listed on the first existence check
+        self._existing: Optional[Set[str]] = None
 
     def write_camera(self, camera: Camera) -> Path:
         """Write camera data to YAML file.
@@ -29,40 +34,53 @@ class YAMLWriter:
         Returns:
             Path to written file
         """
+        if not self._dir_created:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_created = True
+
         filename = f"{camera.ProductCode}.yaml"
         filepath = self.output_dir / filename
 
         # Convert to dict with proper ordering
         data = camera.to_yaml_dict()
 
-        # Write YAML with custom formatting
-        with open(filepath, "w", encoding="utf-8") as f:
-            # Use custom dumper for proper formatting
-            yaml.dump(
-                data,
-                f,
-                Dumper=CustomDumper,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False,
-                width=1000,  # Prevent line wrapping
-                indent=4,
-            )
-
-        logger.info(f"Wrote YAML file: {filepath}")
+        # Serialize in memory so the file gets one write instead of one per token
+        text = _dump_yaml(data)
+
+        # Write to a temp file and rename it into place, so an interrupted run
+        # never leaves a truncated YAML file that camera_exists would skip
+        tmp_path = filepath.with_name(f"{filename}.tmp")
+        tmp_path.write_bytes(text.encode("utf-8"))
+        os.replace(tmp_path, filepath)
+        if self._existing is not None:
+            self._existing.add(camera.ProductCode)
+
+        logger.debug(f"Wrote YAML file: {filepath}")
         return filepath
 
     def camera_exists(self, product_code: str) -> bool:
         """Check if camera YAML file already exists.
 
+        The output directory is listed once and kept up to date by write_camera,
+        so checking every product of a resumed run doesn't stat each file.
+
         Args:
             product_code: Product code to check
 
         Returns:
             True if file exists
         """
-        filepath = self.output_dir / f"{product_code}.yaml"
-        return filepath.exists()
+        if self._existing is None:
+            try:
+                with os.scandir(self.output_dir) as entries:
+                    self._existing = {
+                        entry.name[: -len(".yaml")]
+                        for entry in entries
+                        if entry.name.endswith(".yaml")
+                    }
+            except FileNotFoundError:
+                self._existing = set()
+        return product_code in self._existing
 
 
 class CustomDumper(yaml.SafeDumper):
@@ -76,22 +94,34 @@ class CustomDumper(yaml.SafeDumper):
         return super().increase_indent(flow, False)
 
 
+# Strings YAML would read back as booleans/null, so they must be quoted
+YAML_KEYWORDS = frozenset({"yes", "no", "true", "false", "null", "on", "off"})
+# Longer strings can't be keywords, which skips the lower() copy for most values
+YAML_KEYWORD_MAX_LEN = max(map(len, YAML_KEYWORDS))
+# Non-digit characters a number-like string may start with
+NUMBER_START_CHARS = frozenset(".-")
+
+
 # Custom YAML representer for better formatting
 def _str_representer(dumper: yaml.Dumper, data: str) -> yaml.Node:
     """Custom string representer for multiline strings and empty strings."""
+    length = len(data)
     if "\n" in data:
         # Use literal style for multiline strings
         return dumper.represent_scalar("tag:yaml.org,2002:str", data, style="|")
-    elif data == "":
+    elif length == 0:
         # Use double quotes for empty strings to match sample format
         return dumper.represent_scalar("tag:yaml.org,2002:str", data, style='"')
-    elif len(data) > 100:
+    elif length > 100:
         # Long strings (like ExecutiveSummary) - use single quotes to match sample format
         return dumper.represent_scalar("tag:yaml.org,2002:str", data, style="'")
-    elif data.isdigit() or (data.replace('.', '', 1).replace('-', '', 1).isdigit()):
-        # Numbers as strings - use double quotes
+    elif (data[0] in NUMBER_START_CHARS or data[0].isdigit()) and (
+        data.replace('.', '', 1).replace('-', '', 1).isdigit()
+    ):
+        # Numbers as strings - use double quotes. Only strings starting with a
+        # digit, '.' or '-' can qualify, so most values skip the replace copies
         return dumper.represent_scalar("tag:yaml.org,2002:str", data, style='"')
-    elif data.lower() in ('yes', 'no', 'true', 'false', 'null', 'on', 'off'):
+    elif length <= YAML_KEYWORD_MAX_LEN and data.lower() in YAML_KEYWORDS:
         # YAML keywords - use double quotes
         return dumper.represent_scalar("tag:yaml.org,2002:str", data, style='"')
     else:
@@ -99,14 +129,17 @@ def _str_representer(dumper: yaml.Dumper, data: str) -> yaml.Node:
         return dumper.represent_scalar("tag:yaml.org,2002:str", data)
 
 
-def _list_representer(dumper: yaml.Dumper, data: list) -> yaml.Node:
-    """Custom list representer to handle empty lists."""
-    if not data:
-        # Represent empty lists as empty arrays
-        return dumper.represent_list([])
-    return dumper.represent_list(data)
-
-
-# Register custom representers
+# Register custom representers on CustomDumper only, so other yaml.dump calls
+# keep PyYAML's defaults; lists (empty ones included) use the inherited representer
 CustomDumper.add_representer(str, _str_representer)
-CustomDumper.add_representer(list, _list_representer)
+
+# yaml.dump with the formatting every camera file is written with
+_dump_yaml = partial(
+    yaml.dump,
+    Dumper=CustomDumper,
+    default_flow_style=False,
+    allow_unicode=True,
+    sort_keys=False,
+    width=1000,  # Prevent line wrapping
+    indent=4,
+)
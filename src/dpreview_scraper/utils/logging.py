@@ -1,15 +1,42 @@
 """Logging configuration."""
 
+import atexit
+import copy
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 from rich.logging import RichHandler
 from rich.console import Console
 
+from dpreview_scraper.config import settings
+
 console = Console()
+# Background thread that writes queued log records; started by the first setup_logging()
+_listener: Optional[QueueListener] = None
+
+
+class _ExcInfoQueueHandler(QueueHandler):
+    """Queue handler that leaves exception rendering to the output handler.
+
+    The stock QueueHandler formats the traceback into the message and drops
+    exc_info, which would stop RichHandler from drawing its tracebacks (and
+    showing locals in verbose mode). Records stay in-process, so the live
+    exception can travel with them.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message arguments, keeping exc_info and stack_info."""
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
 
 
 def setup_logging(verbose: bool = False) -> logging.Logger:
-    """Configure logging with Rich handler.
+    """Configure logging, with a Rich handler when writing to a terminal.
 
     Args:
         verbose: Enable verbose logging
@@ -19,19 +46,38 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
     """
     level = logging.DEBUG if verbose else logging.INFO
 
-    # Configure root logger
-    logging.basicConfig(
-        level=level,
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[
-            RichHandler(
+    # Records are handed to a background thread for formatting and output, so
+    # logging calls on the event loop never block on console I/O. Only the first
+    # call sets this up; later calls just adjust the package logger level.
+    global _listener
+    if _listener is None:
+        # Rich rendering is for people watching a terminal; redirected or bulk
+        # runs get a plain handler, which is much cheaper per record. Both write
+        # to stdout, the stream the console's terminal check looks at.
+        if console.is_terminal and not settings.plain_logs:
+            handler = RichHandler(
                 console=console,
                 rich_tracebacks=True,
                 tracebacks_show_locals=verbose,
             )
-        ],
-    )
+        else:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(
+                logging.Formatter("%(asctime)s %(levelname)s %(message)s", datefmt="%H:%M:%S")
+            )
+
+        log_queue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+        # Configure root logger
+        logging.basicConfig(
+            level=level,
+            format="%(message)s",
+            datefmt="[%X]",
+            handlers=[_ExcInfoQueueHandler(log_queue)],
+        )
 
     # Return logger for this package
     logger = logging.getLogger("dpreview_scraper")
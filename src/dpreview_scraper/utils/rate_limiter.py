@@ -25,16 +25,20 @@ class RateLimiter:
         self.requests_per_minute = requests_per_minute
         self.jitter_min = jitter_min
         self.jitter_max = jitter_max
+        # Private generator, so jitter is unaffected by (and doesn't affect) global seeding
+        self._uniform = random.Random().uniform
 
         # Token bucket parameters
         self.tokens = float(requests_per_minute)
         self.max_tokens = float(requests_per_minute)
         self.refill_rate = requests_per_minute / 60.0  # tokens per second
-        self.last_refill = time.time()
+        # Monotonic clock, so wall-clock jumps (e.g. NTP) can't skew the refill math
+        self._now = time.monotonic
+        self.last_refill = self._now()
 
     def _refill_tokens(self) -> None:
         """Refill tokens based on elapsed time."""
-        now = time.time()
+        now = self._now()
         elapsed = now - self.last_refill
         self.tokens = min(
             self.max_tokens, self.tokens + elapsed * self.refill_rate
@@ -47,21 +51,20 @@ class RateLimiter:
         Args:
             tokens: Number of tokens to acquire
         """
-        while True:
-            self._refill_tokens()
+        self._refill_tokens()
 
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                # Add jitter to make requests look more human-like
-                jitter = random.uniform(self.jitter_min, self.jitter_max)
-                await asyncio.sleep(jitter)
-                return
+        # Take the tokens now, going into debt if the bucket is short, and sleep
+        # until the debt is repaid. Concurrent callers see each other's debt, so
+        # they queue up behind one another without re-checking in a loop.
+        self.tokens -= tokens
+        wait_time = max(0.0, -self.tokens / self.refill_rate)
 
-            # Wait for tokens to refill
-            wait_time = (tokens - self.tokens) / self.refill_rate
-            await asyncio.sleep(wait_time)
+        # Add jitter to make requests look more human-like; it shares the refill
+        # sleep, and the time it adds is credited by the next refill
+        jitter = self._uniform(self.jitter_min, self.jitter_max)
+        await asyncio.sleep(wait_time + jitter)
 
     def available_tokens(self) -> float:
-        """Get current number of available tokens."""
+        """Get current number of available tokens (negative while callers are waiting)."""
         self._refill_tokens()
         return self.tokens
@@ -0,0 +1,128 @@
+"""Tests for Wayback Machine archive integration."""
+
+import httpx
+import pytest
+
+from dpreview_scraper.scraper.archive import ArchiveManager
+
+
+def _availability_response(request: httpx.Request) -> httpx.Response:
+    """Fake availability API: only URLs containing 'archived' have a snapshot."""
+    url = request.url.params["url"]
+    if "archived" in url:
+        closest = {"available": True, "url": f"https://web.archive.org/web/2024/{url}"}
+        return httpx.Response(200, json={"archived_snapshots": {"closest": closest}})
+    return httpx.Response(200, json={"archived_snapshots": {}})
+
+
+class TestArchiveManager:
+    @pytest.mark.asyncio
+    async def test_get_archive_url_found(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_availability_response))
+        async with ArchiveManager(client=client) as manager:
+            result = await manager.get_archive_url("https://example.com/archived")
+        await client.aclose()
+        assert result == "https://web.archive.org/web/2024/https://example.com/archived"
+
+    @pytest.mark.asyncio
+    async def test_get_archive_url_missing(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_availability_response))
+        async with ArchiveManager(client=client) as manager:
+            result = await manager.get_archive_url("https://example.com/new")
+        await client.aclose()
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_get_archive_urls_preserves_order(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_availability_response))
+        urls = [
+            "https://example.com/archived-1",
+            "https://example.com/new",
+            "https://example.com/archived-2",
+        ]
+        async with ArchiveManager(client=client) as manager:
+            results = await manager.get_archive_urls(urls, concurrency=2)
+        await client.aclose()
+        assert results[0].endswith("archived-1")
+        assert results[1] is None
+        assert results[2].endswith("archived-2")
+
+    @pytest.mark.asyncio
+    async def test_get_archive_url_retries_transient_errors(self):
+        calls = []
+
+        def flaky(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(503)
+            return _availability_response(request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(flaky))
+        async with ArchiveManager(client=client) as manager:
+            manager.RETRY_MIN_WAIT = 0.0
+            manager.RETRY_MAX_WAIT = 0.0
+            result = await manager.get_archive_url("https://example.com/archived")
+        await client.aclose()
+        assert len(calls) == 3
+        assert result is not None
+
+    @pytest.mark.asyncio
+    async def test_get_archive_url_gives_up_after_attempts(self):
+        calls = []
+
+        def failing(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(503)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(failing))
+        async with ArchiveManager(client=client) as manager:
+            manager.RETRY_MIN_WAIT = 0.0
+            manager.RETRY_MAX_WAIT = 0.0
+            result = await manager.get_archive_url("https://example.com/archived")
+        await client.aclose()
+        assert len(calls) == 3
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookups_use_cache(self):
+        calls = []
+
+        def counting(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return _availability_response(request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(counting))
+        async with ArchiveManager(client=client) as manager:
+            first = await manager.get_archive_url("https://example.com/archived")
+            second = await manager.get_archive_url("https://example.com/archived")
+            await manager.get_archive_url("https://example.com/new")
+            missing = await manager.get_archive_url("https://example.com/new")
+        await client.aclose()
+        assert first == second
+        assert missing is None
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_lookups_are_not_cached(self):
+        calls = []
+
+        def failing(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(503)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(failing))
+        async with ArchiveManager(client=client) as manager:
+            manager.RETRY_MIN_WAIT = 0.0
+            manager.RETRY_MAX_WAIT = 0.0
+            await manager.get_archive_url("https://example.com/archived")
+            await manager.get_archive_url("https://example.com/archived")
+        await client.aclose()
+        assert len(calls) == 6
+
+    @pytest.mark.asyncio
+    async def test_injected_client_left_open(self):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_availability_response))
+        manager = ArchiveManager(client=client)
+        await manager.close()
+        assert not client.is_closed
+        await client.aclose()
@@ -0,0 +1,100 @@
+"""Tests for browser context management."""
+
+import asyncio
+
+import pytest
+
+from dpreview_scraper.scraper.browser import BrowserManager
+
+
+class TestSharedContext:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_context(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            "dpreview_scraper.scraper.browser.settings.storage_state_file",
+            tmp_path / "state.json",
+        )
+        manager = BrowserManager()
+        created = []
+
+        async def fake_create_context(storage_state=None):
+            await asyncio.sleep(0)  # yield so the callers interleave
+            context = object()
+            created.append(context)
+            return context
+
+        monkeypatch.setattr(manager, "_create_context", fake_create_context)
+        contexts = await asyncio.gather(*(manager._get_shared_context() for _ in range(3)))
+
+        assert len(created) == 1
+        assert all(context is created[0] for context in contexts)
+
+
+class _FakePage:
+    async def close(self):
+        pass
+
+
+class _FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        return _FakePage()
+
+    async def close(self):
+        self.closed = True
+
+
+class TestContextRotation:
+    @pytest.fixture
+    def manager(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            "dpreview_scraper.scraper.browser.settings.storage_state_file",
+            tmp_path / "state.json",
+        )
+        monkeypatch.setattr("dpreview_scraper.scraper.browser.settings.context_rotation_pages", 2)
+
+        async def no_stealth(page):
+            return None
+
+        monkeypatch.setattr(
+            "dpreview_scraper.scraper.browser.STEALTH.apply_stealth_async", no_stealth
+        )
+        manager = BrowserManager()
+        self.created = []
+
+        async def fake_create_context(storage_state=None):
+            context = _FakeContext()
+            self.created.append(context)
+            return context
+
+        async def no_save():
+            return None
+
+        monkeypatch.setattr(manager, "_create_context", fake_create_context)
+        monkeypatch.setattr(manager, "save_storage_state", no_save)
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_context_is_replaced_after_threshold(self, manager):
+        for _ in range(3):
+            async with manager.new_page():
+                pass
+
+        assert len(self.created) == 2
+        assert self.created[0].closed
+        assert not self.created[1].closed
+
+    @pytest.mark.asyncio
+    async def test_retired_context_stays_open_until_its_pages_close(self, manager):
+        async with manager.new_page():
+            async with manager.new_page():
+                pass
+            # Threshold reached while the first page is still open
+            async with manager.new_page():
+                assert len(self.created) == 2
+                assert not self.created[0].closed
+
+        assert self.created[0].closed
+        assert not self.created[1].closed
@@ -0,0 +1,28 @@
+"""Tests for logging configuration."""
+
+import logging
+import queue
+
+from dpreview_scraper.utils.logging import _ExcInfoQueueHandler
+
+
+class TestExcInfoQueueHandler:
+    def test_logged_exception_keeps_exc_info(self):
+        log_queue = queue.SimpleQueue()
+        test_logger = logging.getLogger("dpreview_scraper.tests.queue")
+        test_logger.propagate = False
+        handler = _ExcInfoQueueHandler(log_queue)
+        test_logger.addHandler(handler)
+        try:
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                test_logger.exception("Failed on %s", "a7v")
+        finally:
+            test_logger.removeHandler(handler)
+
+        record = log_queue.get_nowait()
+        assert record.getMessage() == "Failed on a7v"
+        assert record.exc_info[0] is ValueError
+        # The traceback isn't baked into the message; the output handler renders it
+        assert "Traceback" not in record.msg
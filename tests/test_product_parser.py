@@ -10,6 +10,16 @@ from dpreview_scraper.parsers.product_parser import (
     _parse_list_value,
     parse_product_page,
 )
+from dpreview_scraper.parsers.parse_utils import get_element_text
+from dpreview_scraper.parsers.review_parser import _parse_review_page
+from dpreview_scraper.parsers.specs_parser import (
+    CONTENT_TABLE_STRAINER,
+    SPECS_TABLE_STRAINER,
+    extract_full_specs,
+    extract_review_specs,
+    merge_specs,
+)
+from dpreview_scraper.models.specs import CameraSpecs
 from bs4 import BeautifulSoup
 
 
@@ -93,6 +103,81 @@ class TestNormalizeWhitespace:
         assert _normalize_whitespace('3.0 ″') == '3.0″'
 
 
+class TestExtractSpecs:
+    def test_review_specs_from_multiple_tables(self):
+        html = (
+            '<table class="contentTable"><tr><th>Body type</th><td>Mirrorless</td></tr></table>'
+            '<table class="contentTable"><tr><th>Drive modes:</th><td>Single; Continuous</td></tr>'
+            '<tr><th>Unknown label</th><td>ignored</td></tr></table>'
+        )
+        specs = extract_review_specs(BeautifulSoup(html, "lxml"))
+        assert specs.BodyType == "Mirrorless"
+        assert specs.DriveModes == ["Single", "Continuous"]
+
+    def test_full_specs_from_compact_table(self):
+        html = (
+            '<table class="specsTable compact"><tbody>'
+            '<tr><th class="label">Announced</th><td class="value">Announced Oct 1, 2025</td></tr>'
+            '</tbody><tbody>'
+            '<tr><th class="label">Sensor type</th><td class="value">BSI-CMOS</td></tr>'
+            '</tbody></table>'
+        )
+        specs = extract_full_specs(BeautifulSoup(html, "lxml"))
+        assert specs.Announced == "Oct 1, 2025"
+        assert specs.SensorType == "BSI-CMOS"
+
+    def test_strained_soups_match_full_parse(self):
+        html = (
+            '<div class="nav"><table class="contentTable">'
+            '<tr><th>Sensor</th><td>CMOS</td></tr></table></div>'
+            '<table class="specsTable compact"><tbody>'
+            '<tr><th class="label">Body type</th><td class="value">Mirrorless</td></tr>'
+            '</tbody></table><p>Footer</p>'
+        )
+        full_soup = BeautifulSoup(html, "lxml")
+        specs_soup = BeautifulSoup(html, "lxml", parse_only=SPECS_TABLE_STRAINER)
+        content_soup = BeautifulSoup(html, "lxml", parse_only=CONTENT_TABLE_STRAINER)
+        assert extract_full_specs(specs_soup) == extract_full_specs(full_soup)
+        assert extract_review_specs(content_soup) == extract_review_specs(full_soup)
+        assert extract_full_specs(specs_soup).BodyType == "Mirrorless"
+
+    def test_missing_tables_return_empty_specs(self):
+        soup = BeautifulSoup("<html></html>", "lxml")
+        assert extract_full_specs(soup) == CameraSpecs()
+        assert extract_review_specs(soup) == CameraSpecs()
+
+
+class TestMergeSpecs:
+    def test_primary_values_win(self):
+        primary = CameraSpecs(BodyType="Mirrorless", Autofocus=["Phase Detect"])
+        secondary = CameraSpecs(BodyType="SLR", Autofocus=["Contrast Detect"])
+        merged = merge_specs(primary, secondary)
+        assert merged.BodyType == "Mirrorless"
+        assert merged.Autofocus == ["Phase Detect"]
+
+    def test_fills_gaps_from_secondary(self):
+        primary = CameraSpecs(BodyType="Mirrorless")
+        secondary = CameraSpecs(SensorType="BSI-CMOS", DriveModes=["Single"])
+        merged = merge_specs(primary, secondary)
+        assert merged.BodyType == "Mirrorless"
+        assert merged.SensorType == "BSI-CMOS"
+        assert merged.DriveModes == ["Single"]
+
+
+class TestGetElementText:
+    def test_single_text_node(self):
+        elem = BeautifulSoup("<div>  Portrait photography  </div>", "lxml").find("div")
+        assert get_element_text(elem) == "Portrait photography"
+
+    def test_nested_children_match_get_text(self):
+        elem = BeautifulSoup("<div> Great <b>camera</b> overall </div>", "lxml").find("div")
+        assert get_element_text(elem) == elem.get_text(strip=True)
+
+    def test_ignores_comment_only_content(self):
+        elem = BeautifulSoup("<div><!-- hidden --></div>", "lxml").find("div")
+        assert get_element_text(elem) == ""
+
+
 class TestParseListValue:
     def test_parses_ul_list(self):
         html = "<td><ul><li>Item 1</li><li>Item 2</li></ul></td>"
@@ -106,6 +191,12 @@ class TestParseListValue:
         result = _parse_list_value(elem)
         assert len(result) == 3
 
+    def test_semicolon_takes_priority_over_comma(self):
+        html = "<td>Single; Continuous (high, low); Self-timer</td>"
+        elem = BeautifulSoup(html, "lxml").find("td")
+        result = _parse_list_value(elem)
+        assert result == ["Single", "Continuous (high, low)", "Self-timer"]
+
     def test_single_value(self):
         html = "<td>Single item</td>"
         elem = BeautifulSoup(html, "lxml").find("td")
@@ -113,6 +204,41 @@ class TestParseListValue:
         assert result == ["Single item"]
 
 
+REVIEW_HTML = """
+<html><body>
+<div class="score" data-score="87">Score 87%</div>
+<table>
+<tr class="suitability goodFor"><td><div class="text">Enthusiasts and pros</div></td></tr>
+<tr class="suitability notGoodFor"><td><div class="text">Budget buyers</div></td></tr>
+<tr class="summary"><td><div class="summary">A great camera.</div></td></tr>
+</table>
+</body></html>
+"""
+
+
+class TestParseReviewPage:
+    def test_extracts_review_summary(self):
+        _, summary, _ = _parse_review_page(BeautifulSoup(REVIEW_HTML, "lxml"))
+        assert summary.GoodFor == "Enthusiasts and pros"
+        assert summary.NotSoGoodFor == "Budget buyers"
+        assert summary.Conclusion == "A great camera."
+
+    def test_extracts_score(self):
+        _, _, score = _parse_review_page(BeautifulSoup(REVIEW_HTML, "lxml"))
+        assert score == 87
+
+    def test_score_selector_priority_over_document_order(self):
+        html = '<div class="score">70</div><span class="overallScore">91%</span>'
+        _, _, score = _parse_review_page(BeautifulSoup(html, "lxml"))
+        assert score == 91
+
+    def test_missing_sections_default_to_empty(self):
+        _, summary, score = _parse_review_page(BeautifulSoup("<html></html>", "lxml"))
+        assert summary.GoodFor == ""
+        assert summary.Conclusion == ""
+        assert score == 0
+
+
 class TestParseProductPage:
     def test_parses_from_fixtures(self, product_overview_html, product_specs_html):
         camera = parse_product_page(
@@ -0,0 +1,366 @@
+"""Tests for product scraper helpers."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from dpreview_scraper.scraper import product
+from dpreview_scraper.scraper.product import REVIEW_SPECS_TABLES_SCRIPT, ProductScraper
+from dpreview_scraper.utils.rate_limiter import RateLimiter
+
+
+class _FakePage:
+    async def goto(self, url, **kwargs):
+        self.url = url
+
+    async def wait_for_selector(self, selector, **kwargs):
+        return None
+
+    async def content(self):
+        return f"<html>browser {self.url}</html>"
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.pages_opened = 0
+
+    @asynccontextmanager
+    async def new_page(self):
+        self.pages_opened += 1
+        yield _FakePage()
+
+
+class _CountingRateLimiter(RateLimiter):
+    def __init__(self):
+        super().__init__(jitter_min=0, jitter_max=0)
+        self.acquired = 0
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        self.acquired += 1
+        await super().acquire(tokens)
+
+
+class TestExtractReviewUrl:
+    @pytest.fixture(autouse=True)
+    async def _scraper(self):
+        client = httpx.AsyncClient()
+        self.scraper = ProductScraper(browser_manager=None, rate_limiter=None, http_client=client)
+        yield
+        await client.aclose()
+
+    def test_makes_relative_url_absolute(self):
+        html = '<a class="actionButtonLink" href="/reviews/sony-a7v-review">Read review</a>'
+        url = self.scraper._extract_review_url(html, "sony_a7v")
+        assert url == "https://www.dpreview.com/reviews/sony-a7v-review"
+
+    def test_keeps_absolute_url(self):
+        html = (
+            '<a class="actionButtonLink" href="https://www.dpreview.com/reviews/x">Read</a>'
+        )
+        assert self.scraper._extract_review_url(html, "x") == "https://www.dpreview.com/reviews/x"
+
+    def test_resolves_protocol_relative_url(self):
+        html = '<a class="actionButtonLink" href="//www.dpreview.com/reviews/x">Read</a>'
+        assert self.scraper._extract_review_url(html, "x") == "https://www.dpreview.com/reviews/x"
+
+    def test_matches_multi_class_link(self):
+        html = (
+            '<div><a class="actionButtonLink" href="/products/sony/a7v/buy">Buy</a>'
+            '<a class="button actionButtonLink large" href="/reviews/a7v">Review</a></div>'
+        )
+        assert self.scraper._extract_review_url(html, "a7v").endswith("/reviews/a7v")
+
+    def test_ignores_plain_review_links(self):
+        html = '<a href="/reviews/a7v">Review</a>'
+        assert self.scraper._extract_review_url(html, "a7v") is None
+
+    def test_href_before_class(self):
+        html = '<a href="/reviews/a7v?page=1&amp;x=2" class="actionButtonLink">Review</a>'
+        url = self.scraper._extract_review_url(html, "a7v")
+        assert url == "https://www.dpreview.com/reviews/a7v?page=1&x=2"
+
+    def test_ignores_data_href_attribute(self):
+        html = '<a data-href="/reviews/a7v" class="actionButtonLink" href="/products/a7v">Buy</a>'
+        assert self.scraper._extract_review_url(html, "a7v") is None
+
+    def test_falls_back_to_parser_for_unquoted_attributes(self):
+        html = "<a class=actionButtonLink href=/reviews/a7v>Review</a>"
+        assert self.scraper._extract_review_url(html, "a7v").endswith("/reviews/a7v")
+
+
+class TestFetchPageHtml:
+    @pytest.mark.asyncio
+    async def test_uses_http_when_content_present(self):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, text='<div class="quickSpecs"></div>')
+            )
+        )
+        browser = _FakeBrowser()
+        scraper = ProductScraper(
+            browser, RateLimiter(jitter_min=0, jitter_max=0), http_client=client
+        )
+        html = await scraper._fetch_page_html(
+            "https://example.com/p", "div.quickSpecs", "quickSpecs", "overview", "p"
+        )
+        await client.aclose()
+        assert "quickSpecs" in html
+        assert browser.pages_opened == 0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_browser_on_challenge(self):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(403, text="<title>Just a moment...</title>")
+            )
+        )
+        browser = _FakeBrowser()
+        scraper = ProductScraper(
+            browser, RateLimiter(jitter_min=0, jitter_max=0), http_client=client
+        )
+        html = await scraper._fetch_page_html(
+            "https://example.com/p", "div.quickSpecs", "quickSpecs", "overview", "p"
+        )
+        await client.aclose()
+        assert html == "<html>browser https://example.com/p</html>"
+        assert browser.pages_opened == 1
+
+    @pytest.mark.asyncio
+    async def test_browser_fallback_takes_its_own_rate_limit_token(self):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(403))
+        )
+        rate_limiter = _CountingRateLimiter()
+        scraper = ProductScraper(_FakeBrowser(), rate_limiter, http_client=client)
+        for url in ("https://example.com/a", "https://example.com/b"):
+            await scraper._fetch_page_html(url, "div.quickSpecs", "quickSpecs", "overview", "p")
+        await client.aclose()
+        # HTTP + browser for the first page; browser only once HTTP is known to be blocked
+        assert rate_limiter.acquired == 3
+
+    @pytest.mark.asyncio
+    async def test_challenge_makes_browser_fallback_sticky(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(403, text="<title>Just a moment...</title>")
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        browser = _FakeBrowser()
+        scraper = ProductScraper(
+            browser, RateLimiter(jitter_min=0, jitter_max=0), http_client=client
+        )
+        for url in ("https://example.com/a", "https://example.com/b"):
+            await scraper._fetch_page_html(url, "div.quickSpecs", "quickSpecs", "overview", "p")
+        await client.aclose()
+        assert len(requests) == 1
+        assert browser.pages_opened == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_content_does_not_disable_http(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text="<html></html>")
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        scraper = ProductScraper(
+            _FakeBrowser(), RateLimiter(jitter_min=0, jitter_max=0), http_client=client
+        )
+        for url in ("https://example.com/a", "https://example.com/b"):
+            await scraper._fetch_page_html(url, "div.quickSpecs", "quickSpecs", "overview", "p")
+        await client.aclose()
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_overview_without_review_link_skips_review_fetch(self):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, text='<div class="quickSpecs"></div>')
+            )
+        )
+        browser = _FakeBrowser()
+        scraper = ProductScraper(
+            browser, RateLimiter(jitter_min=0, jitter_max=0), http_client=client
+        )
+        result = await scraper._fetch_overview_and_review("https://example.com/p", "p")
+        await client.aclose()
+        assert result == ('<div class="quickSpecs"></div>', None, None, None)
+        assert browser.pages_opened == 0
+
+
+class TestScrapeProduct:
+    @pytest.mark.asyncio
+    async def test_fetch_failure_is_reraised_unwrapped(self):
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        from dpreview_scraper.models.camera import SearchResult
+
+        class _TimeoutPage(_FakePage):
+            async def goto(self, url, **kwargs):
+                raise PlaywrightTimeoutError("navigation timed out")
+
+        class _TimeoutBrowser(_FakeBrowser):
+            @asynccontextmanager
+            async def new_page(self):
+                yield _TimeoutPage()
+
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+        scraper = ProductScraper(
+            _TimeoutBrowser(), RateLimiter(jitter_min=0, jitter_max=0), http_client=client
+        )
+        search_result = SearchResult(
+            product_code="a7v", name="Sony a7 V", url="/products/sony/slrs/sony_a7v"
+        )
+        # Bypass the retry decorator so the failure surfaces on the first attempt
+        with pytest.raises(PlaywrightTimeoutError):
+            await ProductScraper.scrape_product.__wrapped__(scraper, search_result)
+        await client.aclose()
+
+
+class _SlowPage(_FakePage):
+    async def goto(self, url, **kwargs):
+        self.url = url
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(status=200, headers={})
+
+    async def evaluate(self, script):
+        if script == REVIEW_SPECS_TABLES_SCRIPT:
+            return f'<table class="contentTable">{self.url}</table>'
+        return []
+
+
+class _CountingBrowser(_FakeBrowser):
+    def __init__(self):
+        super().__init__()
+        self.open_now = 0
+        self.max_open = 0
+        self.saved_state = False
+
+    @asynccontextmanager
+    async def new_page(self):
+        self.pages_opened += 1
+        self.open_now += 1
+        self.max_open = max(self.max_open, self.open_now)
+        try:
+            yield _SlowPage()
+        finally:
+            self.open_now -= 1
+
+    async def save_storage_state(self):
+        self.saved_state = True
+
+
+class TestBrowserPages:
+    @pytest.fixture(autouse=True)
+    def _no_review_delay(self, monkeypatch):
+        monkeypatch.setattr(product, "REVIEW_PAGE_EXTRA_DELAY", (0, 0))
+
+    @pytest.mark.asyncio
+    async def test_open_pages_are_bounded(self):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(403))
+        )
+        browser = _CountingBrowser()
+        scraper = ProductScraper(
+            browser, RateLimiter(jitter_min=0, jitter_max=0), http_client=client, max_open_pages=2
+        )
+        await asyncio.gather(
+            *(
+                scraper._fetch_page_html(
+                    f"https://example.com/{i}", "div.quickSpecs", "quickSpecs", "overview", "p"
+                )
+                for i in range(6)
+            )
+        )
+        await client.aclose()
+        assert browser.pages_opened == 6
+        assert browser.max_open == 2
+
+    @pytest.mark.asyncio
+    async def test_review_specs_load_after_review_page(self):
+        client = httpx.AsyncClient()
+        browser = _CountingBrowser()
+        scraper = ProductScraper(
+            browser, RateLimiter(jitter_min=0, jitter_max=0), http_client=client
+        )
+        review_html, review_specs_html = await scraper._fetch_review_pages(
+            "https://example.com/reviews/a7v", "a7v"
+        )
+        await client.aclose()
+        assert review_html == "<html>browser https://example.com/reviews/a7v</html>"
+        assert review_specs_html == (
+            '<table class="contentTable">https://example.com/reviews/a7v/2</table>'
+        )
+        assert browser.pages_opened == 2
+        assert browser.saved_state
+
+    @pytest.mark.asyncio
+    async def test_blocked_review_page_skips_specs_page(self):
+        class _ChallengePage(_SlowPage):
+            async def content(self):
+                return "<html><head><title>Just a moment...</title></head></html>"
+
+        class _ChallengeBrowser(_CountingBrowser):
+            def __init__(self):
+                super().__init__()
+                self.urls = []
+
+            @asynccontextmanager
+            async def new_page(self):
+                self.pages_opened += 1
+                page = _ChallengePage()
+                yield page
+                self.urls.append(page.url)
+
+        client = httpx.AsyncClient()
+        browser = _ChallengeBrowser()
+        scraper = ProductScraper(
+            browser, RateLimiter(jitter_min=0, jitter_max=0), http_client=client
+        )
+        result = await scraper._fetch_review_pages("https://example.com/reviews/a7v", "a7v")
+        await client.aclose()
+        assert result == (None, None)
+        # Page 2 of the review is never requested while the review page is blocked
+        assert browser.urls == ["https://example.com/reviews/a7v"]
+        assert not scraper._has_fresh_clearance()
+
+    @pytest.mark.asyncio
+    async def test_successful_review_stamps_clearance(self):
+        client = httpx.AsyncClient()
+        scraper = ProductScraper(
+            _CountingBrowser(), RateLimiter(jitter_min=0, jitter_max=0), http_client=client
+        )
+        assert not scraper._has_fresh_clearance()
+        await scraper._fetch_review_pages("https://example.com/reviews/a7v", "a7v")
+        await client.aclose()
+        assert scraper._has_fresh_clearance()
+
+    @pytest.mark.asyncio
+    async def test_listing_review_url_loads_alongside_overview(self):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(403))
+        )
+        browser = _CountingBrowser()
+        scraper = ProductScraper(
+            browser, RateLimiter(jitter_min=0, jitter_max=0), http_client=client
+        )
+        overview_html, review_url, review_html, review_specs_html = (
+            await scraper._fetch_overview_and_review(
+                "https://example.com/p", "p", "https://example.com/reviews/p"
+            )
+        )
+        await client.aclose()
+        assert overview_html == "<html>browser https://example.com/p</html>"
+        assert review_url == "https://example.com/reviews/p"
+        assert review_html == "<html>browser https://example.com/reviews/p</html>"
+        assert review_specs_html is not None
+        # The review tab opened while the overview was still loading
+        assert browser.max_open >= 2
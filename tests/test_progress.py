@@ -62,6 +62,7 @@ class TestProgressTracker:
         tracker.start(5)
         tracker.mark_completed("cam_a")
         tracker.mark_failed("cam_b")
+        tracker.flush()
 
         # Load from file again
         tracker2 = ProgressTracker(progress_file)
@@ -84,9 +85,22 @@ class TestProgressTracker:
         tracker = ProgressTracker(progress_file)
         tracker.start(3)
         tracker.mark_completed("cam_a")
+        tracker.flush()
 
         with open(progress_file) as f:
             data = json.load(f)
         assert "completed" in data
         assert "cam_a" in data["completed"]
         assert data["total"] == 3
+
+    def test_marks_are_saved_in_batches(self, tmp_path):
+        progress_file = tmp_path / "progress.json"
+        tracker = ProgressTracker(progress_file, flush_every=2)
+        tracker.start(3)
+        tracker.mark_completed("cam_a")
+        assert ProgressTracker(progress_file).completed == set()
+
+        tracker.mark_failed("cam_b")
+        reloaded = ProgressTracker(progress_file)
+        assert reloaded.completed == {"cam_a"}
+        assert reloaded.failed == {"cam_b"}
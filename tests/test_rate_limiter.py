@@ -39,17 +39,35 @@ class TestRateLimiter:
         elapsed = time.time() - start
         assert elapsed >= 0.05
 
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_deficit(self):
+        limiter = RateLimiter(requests_per_minute=600, jitter_min=0, jitter_max=0)
+        limiter.tokens = 0.0
+        start = time.monotonic()
+        await limiter.acquire()
+        # 600 rpm refills one token every 0.1s
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_queue_up(self):
+        limiter = RateLimiter(requests_per_minute=600, jitter_min=0, jitter_max=0)
+        limiter.tokens = 0.0
+        start = time.monotonic()
+        await asyncio.gather(limiter.acquire(), limiter.acquire())
+        # The second caller waits behind the first one's debt
+        assert time.monotonic() - start >= 0.19
+
     def test_refill_over_time(self):
         limiter = RateLimiter(requests_per_minute=60, jitter_min=0, jitter_max=0)
         limiter.tokens = 0.0
         # Simulate time passing
-        limiter.last_refill = time.time() - 1.0  # 1 second ago
+        limiter.last_refill = time.monotonic() - 1.0  # 1 second ago
         tokens = limiter.available_tokens()
         # Should refill ~1 token per second at 60 rpm
         assert tokens >= 0.9
 
     def test_tokens_capped_at_max(self):
         limiter = RateLimiter(requests_per_minute=10, jitter_min=0, jitter_max=0)
-        limiter.last_refill = time.time() - 600  # 10 minutes ago
+        limiter.last_refill = time.monotonic() - 600  # 10 minutes ago
         tokens = limiter.available_tokens()
         assert tokens == 10.0
@@ -45,6 +45,56 @@ class TestParseSearchResults:
         results = parse_search_results(html)
         assert results == []
 
+    def test_falls_back_to_url_for_product_code(self):
+        html = (
+            '<table><tr class="product"><td class="info"><div class="name">'
+            '<a href="/products/sony/slrs/sony_a7v">Sony a7 V</a></div></td></tr></table>'
+        )
+        results = parse_search_results(html)
+        assert len(results) == 1
+        assert results[0].product_code == "sony_a7v"
+
+    def test_parses_row_with_multiple_classes(self):
+        html = (
+            '<table><tr id="product_leica_sl3s" class="product last"><td class="info">'
+            '<div class="name"><a href="/products/leica/slrs/leica_sl3s">Leica SL3-S</a></div>'
+            '</td></tr></table>'
+        )
+        results = parse_search_results(html)
+        assert [r.product_code for r in results] == ["leica_sl3s"]
+
+    def test_skips_rows_without_name_link(self):
+        html = (
+            '<table><tr id="product_broken" class="product"><td class="info"></td></tr>'
+            '<tr id="product_sony_a7v" class="product"><td class="info"><div class="name">'
+            '<a href="/products/sony/slrs/sony_a7v">Sony a7 V</a></div></td></tr></table>'
+        )
+        results = parse_search_results(html)
+        assert [r.product_code for r in results] == ["sony_a7v"]
+
+    def test_extracts_review_link_from_listing(self):
+        html = (
+            '<table><tr id="product_a" class="product"><td class="info"><div class="name">'
+            '<a href="/products/x/slrs/a">A</a></div></td><td class="review"><div>'
+            '<a href="https://www.dpreview.com/reviews/a-review"><span class="score">82%</span>'
+            '</a></div></td></tr>'
+            '<tr id="product_b" class="product"><td class="info"><div class="name">'
+            '<a href="/products/x/slrs/b">B</a></div></td><td class="review"></td></tr></table>'
+        )
+        results = parse_search_results(html)
+        assert results[0].review_url == "https://www.dpreview.com/reviews/a-review"
+        assert results[1].review_url is None
+
+    def test_makes_relative_review_link_absolute(self):
+        html = (
+            '<table><tr class="product" id="product_a"><td class="info"><div class="name">'
+            '<a href="/products/x/slrs/a">A</a></div></td><td class="review"><div>'
+            '<a href="/reviews/a-review"><span class="score">82%</span></a></div></td></tr>'
+            "</table>"
+        )
+        results = parse_search_results(html)
+        assert results[0].review_url == "https://www.dpreview.com/reviews/a-review"
+
 
 class TestExtractPaginationInfo:
     def test_detects_next_page(self, camera_list_html):
@@ -60,3 +110,21 @@ class TestExtractPaginationInfo:
         assert info["current_page"] == 1
         assert info["total_pages"] == 1
         assert info["has_next"] is False
+
+    def test_page_number_from_next_link_query(self):
+        html = (
+            '<html><head><link rel="next" '
+            'href="/products/cameras/all?view=list&amp;page=3&amp;sort=date"></head></html>'
+        )
+        info = extract_pagination_info(html)
+        assert info["has_next"] is True
+        assert info["current_page"] == 2
+
+    def test_total_pages_ignores_non_numeric_links(self):
+        html = (
+            '<table class="pager"><tr><td><a class="current">2</a><a>1</a><a>7</a>'
+            '<a>Next</a></td></tr></table>'
+        )
+        info = extract_pagination_info(html)
+        assert info["current_page"] == 2
+        assert info["total_pages"] == 7
@@ -0,0 +1,42 @@
+"""Tests for search scraper helpers."""
+
+from datetime import datetime
+
+from dpreview_scraper.models.camera import SearchResult
+from dpreview_scraper.scraper.search import SearchScraper, _parse_announced
+
+
+class TestParseAnnounced:
+    def test_iso_date(self):
+        assert _parse_announced("2024-05-14") == datetime(2024, 5, 14)
+
+    def test_iso_year_month(self):
+        assert _parse_announced("2024-05") == datetime(2024, 5, 1)
+
+    def test_month_name_formats(self):
+        assert _parse_announced("May 14, 2024") == datetime(2024, 5, 14)
+        assert _parse_announced("September 3, 2023") == datetime(2023, 9, 3)
+        assert _parse_announced("Sep 2023") == datetime(2023, 9, 1)
+
+    def test_non_padded_numeric_dates(self):
+        assert _parse_announced("2023-3-7") == datetime(2023, 3, 7)
+        assert _parse_announced("2023-3") == datetime(2023, 3, 1)
+
+    def test_relative_date_is_unparsed(self):
+        assert _parse_announced("Announced 2 months ago") is None
+
+
+class TestFilterByDate:
+    def test_keeps_recent_and_unparseable_dates(self):
+        scraper = SearchScraper(browser_manager=None, rate_limiter=None, after_date="2024-01-01")
+        results = [
+            SearchResult(product_code=code, name=code, url=f"/products/{code}", announced=announced)
+            for code, announced in [
+                ("new", "2024-03-01"),
+                ("old", "Jun 2022"),
+                ("relative", "Announced 2 months ago"),
+                ("undated", None),
+            ]
+        ]
+        kept = [r.product_code for r in scraper._filter_by_date(results)]
+        assert kept == ["new", "relative", "undated"]
@@ -0,0 +1,145 @@
+"""Tests for Cloudflare challenge detection."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from dpreview_scraper.scraper import stealth
+from dpreview_scraper.scraper.stealth import (
+    COOKIE_BUTTON_SELECTORS,
+    check_and_dismiss_cookie_popup,
+    is_cloudflare_challenge_html,
+    is_cloudflare_challenge_response,
+    wait_for_cloudflare_challenge,
+)
+
+
+def _response(status: int, headers: dict | None = None) -> SimpleNamespace:
+    return SimpleNamespace(status=status, headers=headers or {})
+
+
+class TestIsCloudflareChallengeResponse:
+    def test_ok_response_from_cloudflare_is_not_a_challenge(self):
+        assert not is_cloudflare_challenge_response(_response(200, {"server": "cloudflare"}))
+
+    def test_error_status_is_a_challenge(self):
+        assert is_cloudflare_challenge_response(_response(403))
+        assert is_cloudflare_challenge_response(_response(503))
+
+    def test_mitigated_header_is_a_challenge(self):
+        assert is_cloudflare_challenge_response(_response(200, {"cf-mitigated": "challenge"}))
+
+    def test_missing_response_is_treated_as_a_challenge(self):
+        assert is_cloudflare_challenge_response(None)
+
+
+class TestIsCloudflareChallengeHtml:
+    def test_detects_challenge_title(self):
+        html = "<html><head><title>Just a moment...</title></head><body></body></html>"
+        assert is_cloudflare_challenge_html(html)
+
+    def test_review_page_is_not_a_challenge(self):
+        html = '<html><head><title lang="en">Sony a7 V review</title></head></html>'
+        assert not is_cloudflare_challenge_html(html)
+
+    def test_ignores_indicator_outside_title(self):
+        html = "<html><head><title>Review</title></head><body>Just a moment</body></html>"
+        assert not is_cloudflare_challenge_html(html)
+
+
+class _FakeLocator:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+        self.first = self
+
+    async def click(self, **kwargs):
+        self.page.attempts.append(self.selector)
+        if self.selector in self.page.unclickable:
+            raise TimeoutError("element is not visible")
+
+
+class _FakeCookiePage:
+    def __init__(self, found, unclickable=()):
+        self.found = found
+        self.unclickable = set(unclickable)
+        self.attempts = []
+
+    async def evaluate(self, script):
+        return self.found
+
+    def locator(self, selector):
+        return _FakeLocator(self, selector)
+
+
+class TestCheckAndDismissCookiePopup:
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self, monkeypatch):
+        async def no_sleep(seconds):
+            return None
+
+        monkeypatch.setattr(stealth.asyncio, "sleep", no_sleep)
+
+    @pytest.mark.asyncio
+    async def test_falls_through_to_next_candidate_when_click_fails(self):
+        first, second = COOKIE_BUTTON_SELECTORS[0], COOKIE_BUTTON_SELECTORS[5]
+        page = _FakeCookiePage(found=[0, 5], unclickable={first})
+        assert await check_and_dismiss_cookie_popup(page)
+        assert page.attempts == [first, second]
+
+    @pytest.mark.asyncio
+    async def test_returns_false_when_nothing_matches(self):
+        page = _FakeCookiePage(found=[])
+        assert not await check_and_dismiss_cookie_popup(page)
+        assert page.attempts == []
+
+
+class _FakeChallengePage:
+    viewport_size = {"width": 1280, "height": 800}
+
+    def __init__(self, resolve_after_moves=0):
+        self.mouse = SimpleNamespace(move=self._move)
+        self.mouse_moves = 0
+        self.resolve_after_moves = resolve_after_moves
+
+    async def _move(self, x, y):
+        self.mouse_moves += 1
+
+    async def evaluate(self, script, *args):
+        return ["Just a moment...", False]
+
+    async def wait_for_function(self, script, **kwargs):
+        # The challenge clears once the simulated visitor has moved the mouse enough
+        while self.mouse_moves < self.resolve_after_moves:
+            await asyncio.sleep(0)
+        return True
+
+
+class TestWaitForCloudflareChallenge:
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self, monkeypatch):
+        real_sleep = asyncio.sleep
+
+        async def no_sleep(seconds):
+            await real_sleep(0)
+
+        monkeypatch.setattr(stealth.asyncio, "sleep", no_sleep)
+
+    @pytest.mark.asyncio
+    async def test_humanizes_while_waiting(self):
+        page = _FakeChallengePage(resolve_after_moves=3)
+        assert await wait_for_cloudflare_challenge(page)
+        assert page.mouse_moves == 3
+
+    @pytest.mark.asyncio
+    async def test_quick_resolution_does_not_wait_for_simulation(self):
+        page = _FakeChallengePage()
+        assert await wait_for_cloudflare_challenge(page)
+        assert page.mouse_moves < 3
+
+    @pytest.mark.asyncio
+    async def test_can_skip_humanization(self):
+        page = _FakeChallengePage()
+        assert await wait_for_cloudflare_challenge(page, humanize=False)
+        assert page.mouse_moves == 0
@@ -8,42 +8,52 @@ import pytest
 from dpreview_scraper.models.camera import Camera
 from dpreview_scraper.models.review import ReviewData, ReviewSummary
 from dpreview_scraper.models.specs import CameraSpecs
-from dpreview_scraper.storage.yaml_writer import CustomDumper, YAMLWriter
+from dpreview_scraper.storage.yaml_writer import YAMLWriter, _dump_yaml
+
+# Reading back needs no custom formatting, so use libyaml's loader when available
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class TestCustomDumper:
     def test_multiline_strings_use_literal_style(self):
         data = {"text": "line one\nline two\nline three"}
-        output = yaml.dump(data, Dumper=CustomDumper, default_flow_style=False)
+        output = _dump_yaml(data)
         assert "|" in output
 
     def test_empty_strings_use_double_quotes(self):
         data = {"field": ""}
-        output = yaml.dump(data, Dumper=CustomDumper, default_flow_style=False)
+        output = _dump_yaml(data)
         assert '""' in output
 
     def test_numeric_strings_use_double_quotes(self):
         data = {"value": "42"}
-        output = yaml.dump(data, Dumper=CustomDumper, default_flow_style=False)
+        output = _dump_yaml(data)
         assert '"42"' in output
 
     def test_yaml_keywords_use_double_quotes(self):
-        for keyword in ["yes", "no", "true", "false", "null"]:
-            data = {"field": keyword}
-            output = yaml.dump(data, Dumper=CustomDumper, default_flow_style=False)
+        keywords = ["yes", "no", "true", "false", "null", "on", "off", "Yes"]
+        output = _dump_yaml({f"k{i}": keyword for i, keyword in enumerate(keywords)})
+        for keyword in keywords:
             assert f'"{keyword}"' in output
 
     def test_long_strings_use_single_quotes(self):
         long_text = "A" * 150
         data = {"field": long_text}
-        output = yaml.dump(data, Dumper=CustomDumper, default_flow_style=False)
+        output = _dump_yaml(data)
         assert "'" in output
 
     def test_empty_list_representation(self):
         data = {"items": []}
-        output = yaml.dump(data, Dumper=CustomDumper, default_flow_style=False)
+        output = _dump_yaml(data)
         assert "[]" in output
 
+    def test_lists_are_indented_under_their_key(self):
+        # libyaml's C emitter always writes indentless sequences, so this
+        # layout depends on the pure-Python emitter's increase_indent override
+        data = {"ShortSpecs": ["a", "b"]}
+        output = _dump_yaml(data)
+        assert output == "ShortSpecs:\n    - a\n    - b\n"
+
 
 class TestYAMLWriter:
     def test_write_camera_creates_file(self, tmp_path):
@@ -70,11 +80,21 @@ class TestYAMLWriter:
         filepath = writer.write_camera(camera)
         # Verify it's valid YAML that can be loaded back
         with open(filepath) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_Loader)
         assert data["ProductCode"] == "test_camera"
         assert data["ReviewScore"] == 85
         assert data["ShortSpecs"] == ["33 megapixels", "Full frame"]
 
+    def test_write_leaves_no_temp_file(self, tmp_path):
+        writer = YAMLWriter(tmp_path)
+        camera = Camera(
+            ProductCode="test_camera",
+            Name="Test Camera",
+            URL="/products/test/test_camera",
+        )
+        writer.write_camera(camera)
+        assert [p.name for p in tmp_path.iterdir()] == ["test_camera.yaml"]
+
     def test_camera_exists(self, tmp_path):
         writer = YAMLWriter(tmp_path)
         assert not writer.camera_exists("test_camera")
@@ -87,10 +107,23 @@ class TestYAMLWriter:
         writer.write_camera(camera)
         assert writer.camera_exists("test_camera")
 
-    def test_creates_output_directory(self, tmp_path):
+    def test_camera_exists_sees_files_from_earlier_runs(self, tmp_path):
+        (tmp_path / "earlier.yaml").write_text("ProductCode: earlier\n")
+        (tmp_path / "unfinished.yaml.tmp").write_text("")
+        writer = YAMLWriter(tmp_path)
+        assert writer.camera_exists("earlier")
+        assert not writer.camera_exists("unfinished")
+
+    def test_creates_output_directory_on_first_write(self, tmp_path):
         nested = tmp_path / "a" / "b" / "c"
         writer = YAMLWriter(nested)
-        assert nested.exists()
+        assert not nested.exists()
+        assert not writer.camera_exists("test_camera")
+
+        writer.write_camera(
+            Camera(ProductCode="test_camera", Name="Test Camera", URL="/products/test/test_camera")
+        )
+        assert (nested / "test_camera.yaml").exists()
 
     def test_round_trip_preserves_data(self, tmp_path):
         writer = YAMLWriter(tmp_path)
@@ -120,7 +153,7 @@ class TestYAMLWriter:
         filepath = writer.write_camera(camera)
 
         with open(filepath) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_Loader)
 
         assert data["Name"] == "Round Trip Camera"
         assert data["ReviewScore"] == 92